@@ -9,31 +9,33 @@ import sys
 import random
 import logging
 import asyncio
+import time
 from fastapi import FastAPI, HTTPException, WebSocket, Request, Query
-from fastapi.responses import HTMLResponse, JSONResponse, FileResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker
-from sqlalchemy.pool import NullPool
+from contextlib import asynccontextmanager
 from datetime import datetime
 import json
-from dotenv import load_dotenv
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Literal
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends
 from sqlalchemy.future import select
 from sqlalchemy.sql import func
-from database import get_db
+from database import get_engine, get_sessionmaker, pool_status  # Shared engine and pool, built on first use
 from starlette.websockets import WebSocketDisconnect
-from sqlalchemy.orm import selectinload
 from fastapi_socketio import SocketManager
 from pathlib import Path
+from backend.models.logs import Event, configure_logging, get_logger
 
 # Pydantic models for request/response validation
 class NormCreate(BaseModel):
     text: Optional[str] = None
 
+class NormBatchCreate(BaseModel):
+    count: int
+    complexity_distribution: Optional[Dict[int, float]] = None  # {complexity: weight}, uniform if omitted
+
 class NormIdRequest(BaseModel):
     norm_id: int
 
@@ -44,6 +46,12 @@ class NormResponse(BaseModel):
     complexity: int
     constitutional: bool
 
+class SolveCasesRequest(BaseModel):
+    decision: Literal["Accepted", "Rejected"]
+    case_ids: Optional[List[int]] = None  # Explicit ids, or else
+    norm_id: Optional[int] = None         # the pending cases of a norm (all pending cases if omitted)
+    limit: int = 10000
+
 class CaseResponse(BaseModel):
     id: int
     text: str
@@ -52,21 +60,25 @@ class CaseResponse(BaseModel):
     status: str
     resolved_at: Optional[datetime]
 
-logging.basicConfig(level=logging.DEBUG)
+# Queue-based logging: records are formatted and written off the event loop
+configure_logging()
+log = get_logger("api")
+ws_log = get_logger("websocket")
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await start_resources()
+    try:
+        yield
+    finally:
+        await resources.aclose()
+
+app = FastAPI(lifespan=lifespan)
 socket_manager = SocketManager(app=app)
 
 # Define paths
 frontend_path = Path(__file__).parent / "frontend" / "dist"
 
-# Ensure frontend build exists
-if not frontend_path.exists():
-    raise RuntimeError(f"Frontend build not found at: {frontend_path}")
-
-# Serve the entire frontend dist folder
-app.mount("/assets", StaticFiles(directory=str(frontend_path / "assets")), name="assets")
-
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -76,115 +88,195 @@ app.add_middleware(
     allow_headers=["*"],  
 )
 
-# Load environment variables from .env file
-load_dotenv()  # This will look for a .env file in the current working directory
-
-# Access the DATABASE_URL
-DATABASE_URL = os.getenv("DATABASE_URL")
-if not DATABASE_URL:
-    raise ValueError("❌ DATABASE_URL is not set! Check your .env file or environment variables.")
-
-print("Loaded environment variables:")
-print("DATABASE_URL:", DATABASE_URL)
-
-print("Current working directory:", os.getcwd())
-
-engine = create_async_engine(DATABASE_URL, echo=True, future=True)
-
-SessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False)
-
-SessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False)
+# Per-route latency and SQL usage, exposed at /api/metrics
+from backend.models.metrics import metrics, MetricsMiddleware
+app.add_middleware(MetricsMiddleware, registry=metrics)
 
 from backend.models import Base
 from backend.models.norm import Norm
 from backend.models.case import Case
 from backend.models.society import Society
+from backend.models.political_system import PoliticalSystem, MAX_NORM_BATCH
+from backend.models.judicial_system import JudicialSystem, MAX_SOLVE_BATCH
 from backend.models.citizen_pressure import CitizenPressure
-from backend.models.analysis import Counter, NormativeInflationModel
-from backend.models.activity import Activity
+from backend.models.analysis import Counter, NormativeInflationModel, case_decision_summary
+from backend.models.activity import ActivityLog
+from backend.models.notification_manager import broadcaster, notification_store
+from backend.models.dashboard import SnapshotPublisher
+from backend.models.resources import Resources
+from backend.models.static_assets import StaticSite
+from backend.models.generations import generations
+from backend.models.serialization import (
+    ACTIVITY_LIST, CASE_LIST, NORM_LIST, FastJSONResponse, dump_list, json_object
+)
+from backend.models.queries import (
+    CASE_FIELDS, NORM_FIELDS, MAX_PAGE_SIZE, build_export_query, decode_cursor, encode_cursor, fetch_case_page,
+    fetch_norm_rows, load_case, load_norm, parse_fields, stream_ndjson
+)
 #from backend.models import Base
 
-# Dependency for database sessions
+# Committed writes bump per-table generations, the ETags of the list endpoints
+generations.track()
+
+# Engine, society and background services: built on first use, released by the lifespan
+resources = Resources()
+resources.register("engine", lambda: metrics.instrument_engine(get_engine()), close=lambda engine: engine.dispose())
+
+def SessionLocal():
+    """New session on the shared engine (instrumented before its first statement)."""
+    resources.engine
+    return get_sessionmaker()()
+
+# Dependency for database session
 async def get_db():
     async with SessionLocal() as session:
         yield session
 
-# Initialize activities list
-activities = []
+# Recent activities, written behind to the activities table
+MAX_ACTIVITY_ID = 2**31 - 1  # Integer primary key ceiling
+activity_log = ActivityLog(capacity=int(os.getenv("ACTIVITY_LOG_CAPACITY", 1000)))
 
 # Notification System
 class NotificationManager:
-    def __init__(self):
-        self.notifications = []
+    def __init__(self, store=None):
+        self.store = store or notification_store  # Ring buffer with background append-only flush
         self.pending_websocket_events = []
-        self.load_notifications()
 
     def add_notification(self, message: str, type: str = "info"):
-        notification = {
-            "message": message,
-            "timestamp": datetime.now().isoformat(),
-            "type": type
-        }
-        self.notifications.append(notification)
-        self.save_notifications()
+        return self.store.add(message, type)
 
-    def get_notifications(self):
-        return self.notifications
-
-    def save_notifications(self):
-        try:
-            notifications_file = "data/notifications.json"
-            with open(notifications_file, "w") as f:
-                json.dump(self.notifications[-100:], f)
-        except Exception as e:
-            logging.error(f"Failed to save notifications: {e}")
-
-    def load_notifications(self):
-        try:
-            notifications_file = "data/notifications.json"
-            with open(notifications_file, "r") as f:
-                self.notifications = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            self.notifications = []
+    def get_notifications(self, since: Optional[int] = None, limit: Optional[int] = None):
+        return self.store.since(since, limit)
 
     async def broadcast_update(self, event: str, data: dict):
         if socket_manager:
-            if len(connected_clients) > 0:  # Prevent emitting to an empty list
+            if len(broadcaster) > 0:  # Prevent emitting to an empty list
                 await socket_manager.emit(event, data)
-                logging.info(f"📢 WebSocket Event Sent: {event} → {data}")
+                ws_log.debug("📢 WebSocket Event Sent: %s", event)
             else:
-                logging.warning("⚠️ No active WebSockets to send event.")
+                ws_log.warning("⚠️ No active WebSockets to send event.")
         else:
-            logging.warning("⚠️ No active WebSocket! Storing event for later.")
+            ws_log.warning("⚠️ No active WebSocket! Storing event for later.")
             self.pending_websocket_events.append((event, data))
 
 notification_manager = NotificationManager()
 
-# WebSocket Connection Management
-connected_clients = set()
-
 # Global variable for society
 society = None
 
+# Debounced dashboard snapshots pushed over Socket.IO and /ws after writes
+snapshots = SnapshotPublisher(
+    lambda: society.statistics if society else None,
+    min_interval=float(os.getenv("SNAPSHOT_MIN_INTERVAL", 1.0))
+)
+
+async def emit_socketio(event, payload):
+    await socket_manager.emit(event, payload)
+
+async def emit_websocket(event, payload):
+    broadcaster.publish({"event": event, "data": payload})
+
+snapshots.add_emitter(emit_socketio)
+snapshots.add_emitter(emit_websocket)
+
+# Connected Socket.IO clients, for the connection gauge
+socketio_clients = set()
+
+metrics.gauge("websocket_connections", "Open /ws connections.", lambda: len(broadcaster))
+metrics.gauge("socketio_connections", "Connected Socket.IO clients.", lambda: len(socketio_clients))
+metrics.gauge("db_pool_checked_out", "Database connections currently checked out.",
+              lambda: pool_status().get("checked_out", 0))
+
+def adjudication_stat(name):
+    return lambda: society.judicial_system.adjudication.stats()[name] if society and society.judicial_system else 0
+
+metrics.gauge("adjudication_workers", "Configured auto-adjudication workers.", adjudication_stat("workers"))
+metrics.gauge("adjudication_busy_workers", "Workers currently serving a batch.", adjudication_stat("busy_workers"))
+metrics.gauge("adjudication_queue_depth", "Pending cases queued for auto-adjudication.", adjudication_stat("queue_depth"))
+metrics.gauge("adjudication_throughput", "Cases auto-adjudicated per second, recent window.",
+              adjudication_stat("throughput_per_second"))
+metrics.gauge("adjudication_cases_solved_total", "Cases resolved by auto-adjudication.",
+              adjudication_stat("cases_solved"), kind="counter")
+
 @app.get("/api/test")
 async def test_api():
     return {"message": "API is working"}
 
-@app.on_event("startup")
-async def initialize_society():
+# Seconds between statistics cache reconciliation passes
+STATS_RECONCILE_SECONDS = int(os.getenv("STATS_RECONCILE_SECONDS", 300))
+background_tasks = set()
+
+# Seconds the lifespan may take before startup is reported as slow
+STARTUP_BUDGET_SECONDS = float(os.getenv("STARTUP_BUDGET_SECONDS", 0.25))
+startup_seconds = 0.0
+
+def build_society():
+    """Society and its systems; no database access, so it costs microseconds."""
     global society
     society = Society()
-    async with SessionLocal() as session:
-        society.initialize_systems(session)
-    if hasattr(society, "citizen_pressure"):
-        print("✅ `society.citizen_pressure` initialized successfully.")
-    else:
-        print("❌ `society.citizen_pressure` is missing.")
+    society.initialize_systems(None)
+    return society
+
+async def close_society(instance):
+    global society
+    await instance.judicial_system.adjudication.stop()
+    society = None
+
+async def close_background_tasks(tasks):
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    tasks.clear()
+
+async def close_realtime(layer):
+    websockets, publisher = layer
+    await websockets.close()
+    await publisher.close()
+
+resources.register("static", lambda: StaticSite.build(frontend_path))  # Raises if the frontend isn't built
+resources.register("society", build_society, close=close_society)
+resources.register("notifications", lambda: notification_store, close=lambda store: store.stop())
+resources.register("activities", lambda: activity_log, close=lambda log: log.stop())
+resources.register("realtime", lambda: (broadcaster, snapshots), close=close_realtime)
+resources.register("background_tasks", lambda: background_tasks, close=close_background_tasks)
+
+async def warm_up():
+    """Database reads that used to block startup: seed the statistics cache and the activity feed."""
+    try:
+        async with SessionLocal() as session:
+            await society.statistics.update_counts(session)  # Seed the statistics cache once
+    except Exception as e:
+        log.error("Failed to seed statistics cache: %s", e)
+    await activity_log.start(SessionLocal)
+
+async def start_resources():
+    """Lifespan startup: only cheap, local work runs before the first request is accepted."""
+    global startup_seconds
+    started = time.perf_counter()
+    # Tear-down order is the reverse: background tasks, socket layer, stores, society, engine
+    resources.get("static")
+    resources.get("engine")
+    resources.get("society")
+    await resources.get("notifications").start()
+    resources.get("activities")
+    resources.get("realtime")
+    tasks = resources.get("background_tasks")
+    for job in (warm_up(), society.statistics.reconcile_forever(SessionLocal, STATS_RECONCILE_SECONDS)):
+        task = asyncio.create_task(job)
+        tasks.add(task)
+
+    startup_seconds = time.perf_counter() - started
+    timings = ", ".join(f"{name} {seconds * 1000:.1f}ms" for name, seconds in resources.timings.items())
+    level = logging.WARNING if startup_seconds > STARTUP_BUDGET_SECONDS else logging.INFO
+    log.log(level, "🚀 Startup took %.1fms (%s)", startup_seconds * 1000, timings)
+
+metrics.gauge("startup_seconds", "Time spent in the lifespan startup.", lambda: round(startup_seconds, 4))
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     await websocket.accept()
-    connected_clients.add(websocket)
+    broadcaster.register(websocket)  # Own bounded queue and writer task
+    broadcaster.send_to(websocket, {"event": "dashboard_snapshot", "data": snapshots.latest()})
 
     try:
         while True:
@@ -193,34 +285,33 @@ async def websocket_endpoint(websocket: WebSocket):
                 if data.get("type") == "case_solved":
                     case_id = data.get("case_id")
                     if case_id:
-                        for client in list(connected_clients):  # Iterate over a copy to avoid modification issues
-                            try:
-                                await client.send_json({"event": "case_solved", "data": {"case_id": case_id}})
-                            except Exception as e:
-                                logging.error(f"❌ Failed to send WebSocket message: {e}")
-                                connected_clients.remove(client)  # Remove faulty clients
+                        # Enqueue only; each client's writer delivers it at its own pace
+                        broadcaster.publish({"event": "case_solved", "data": {"case_id": case_id}})
             except WebSocketDisconnect as e:
-                logging.warning(f"⚠️ WebSocket disconnected: {e.code} - {e.reason}")
+                ws_log.warning("⚠️ WebSocket disconnected: %s - %s", e.code, e.reason)
                 break  # Exit loop when client disconnects
             except asyncio.CancelledError:
-                logging.info("✅ WebSocket task was cancelled.")
+                ws_log.info("✅ WebSocket task was cancelled.")
                 break
             except Exception as e:
-                logging.error(f"❌ Unexpected WebSocket error: {e}")
+                ws_log.error("❌ Unexpected WebSocket error: %s", e)
                 break
     finally:
         # Ensure client is removed & socket is closed properly
-        if websocket in connected_clients:
-            connected_clients.remove(websocket)
+        await broadcaster.unregister(websocket)
         try:
             await websocket.close()
         except Exception as e:
-            logging.warning(f"⚠️ Attempted to close an already closed WebSocket: {e}")
+            ws_log.warning("⚠️ Attempted to close an already closed WebSocket: %s", e)
 
 # WebSocket Event Handling
 @socket_manager.on('connect')
 async def handle_connect(sid, environ):
-    print("Client connected to WebSocket")
+    ws_log.info("Socket.IO client %s connected", sid)
+    socketio_clients.add(sid)
+
+    # Give the new subscriber the current dashboard state
+    await socket_manager.emit("dashboard_snapshot", snapshots.latest(), to=sid)
 
     # Send pending WebSocket events upon connection
     for event, data in notification_manager.pending_websocket_events:
@@ -229,22 +320,36 @@ async def handle_connect(sid, environ):
 
 @socket_manager.on('disconnect')
 async def handle_disconnect(sid):
-    print("Client disconnected")
+    ws_log.info("Socket.IO client %s disconnected", sid)
+    socketio_clients.discard(sid)
 
 @socket_manager.on('case_solved')
 async def handle_case_solved(sid, data):
     case_id = data.get('case_id')
-    print(f"🟢 Case Solved WebSocket event received for case ID: {case_id}")
+    ws_log.info("🟢 Case Solved WebSocket event received for case ID: %s", case_id)
     if case_id:
         await socket_manager.emit('case_solved', {'case_id': case_id}, broadcast=True)
 
 # API Endpoints
 
 @app.get("/api/activities")
-async def get_activities(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Activity))
-    activities = result.scalars().all()
-    return {"activities": [activity.__dict__ for activity in activities]}
+async def get_activities(
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db)
+):
+    """Newest-first activity feed, keyset-paginated through `next_cursor`."""
+    try:
+        before = decode_cursor(cursor, "id")[0] if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    entries = await activity_log.page(db, limit=limit + 1, before=before)
+    next_cursor = None
+    if len(entries) > limit:
+        # A first page holding only entries not inserted yet continues from the newest persisted one
+        persisted = [entry["id"] for entry in entries[:limit] if entry["id"] is not None]
+        next_cursor = encode_cursor([persisted[-1] if persisted else MAX_ACTIVITY_ID])
+    return FastJSONResponse(json_object(activities=dump_list(ACTIVITY_LIST, entries[:limit]), next_cursor=next_cursor))
 
 @app.post("/api/create_norm", response_model=NormResponse)
 async def create_norm(norm_data: NormCreate, db: AsyncSession = Depends(get_db)):
@@ -260,14 +365,19 @@ async def create_norm(norm_data: NormCreate, db: AsyncSession = Depends(get_db))
         await db.commit()  # Await commit
         await db.refresh(new_norm)  # Await refresh
 
-        # Ensure activities list exists
-        if "activities" in globals():
-            activities.append(f"Created Norm #{new_norm.id}: {new_norm.text}")
+        # Keep the running normative inflation aggregates current
+        if society and society.inflation:
+            society.inflation.record_norms(1)
+            society.statistics.record_norms_created(1)
+
+        activity_log.record("norm_created", f"Created Norm #{new_norm.id}: {new_norm.text}")
 
         # Send notification
         if "notification_manager" in globals():
             notification_manager.add_notification(f"New norm created: {new_norm.text}")
 
+        snapshots.record("norm_created", id=new_norm.id, text=new_norm.text, valid=new_norm.valid)
+
         # WebSocket event
         if "socket_manager" in globals():
             await socket_manager.emit('norm_created', {
@@ -279,24 +389,49 @@ async def create_norm(norm_data: NormCreate, db: AsyncSession = Depends(get_db))
         return new_norm
     except Exception as e:
         await db.rollback()  # Await rollback
-        logging.error(f"Error creating norm: {e}")
+        log.error("Error creating norm: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/create_norms")
+async def create_norms(batch: NormBatchCreate, db: AsyncSession = Depends(get_db)):
+    """Create a burst of norms with one bulk INSERT and return their ids."""
+    if batch.count < 1 or batch.count > MAX_NORM_BATCH:
+        raise HTTPException(status_code=400, detail=f"count must be between 1 and {MAX_NORM_BATCH}.")
+
+    parliament = society.parliament if society and society.parliament else PoliticalSystem()
+    try:
+        created = await parliament.create_norms(db, batch.count, batch.complexity_distribution)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        log.error("Error creating norms: %s", e)
+        raise HTTPException(status_code=500, detail="Failed to create norms.")
+
+    ids = [norm.id for norm in created]
+    if society and society.inflation:
+        society.inflation.record_norms(len(ids))
+        society.statistics.record_norms_created(len(ids))
+    snapshots.record("norms_created", count=len(ids), first_id=ids[0], last_id=ids[-1])
+
+    activity_log.record("norms_created", f"Created {len(ids)} norms (#{ids[0]} to #{ids[-1]})")
+    notification_manager.add_notification(f"{len(ids)} new norms created.")
+    await socket_manager.emit('norms_created', {'ids': ids})
+
+    return {"message": f"Created {len(ids)} norms", "ids": ids}
+
 @app.get("/api/get_norms", response_model=List[NormResponse])
-async def get_norms(db: AsyncSession = Depends(get_db)):
+async def get_norms(cache: dict = Depends(generations.guard("norms")), db: AsyncSession = Depends(get_db)):
     try:
-        result = await db.execute(select(Norm).order_by(Norm.created_at))  # Trier par date de création
-        norms = result.scalars().all()  # Extraire les objets Norm
-        return norms
+        norms = await fetch_norm_rows(db, order_by="created_at")  # Trier par date de création
+        return FastJSONResponse(dump_list(NORM_LIST, norms), headers=cache)
     except Exception as e:
-        logging.error(f"Error fetching norms: {e}")
+        log.error("Error fetching norms: %s", e)
         raise HTTPException(status_code=500, detail="Failed to retrieve norms.")
 
 @app.post("/api/check_constitutionality")
 async def check_constitutionality(request: NormIdRequest, db: AsyncSession = Depends(get_db)):
     try:
-        result = await db.execute(select(Norm).where(Norm.id == request.norm_id))
-        norm = result.scalars().first()
+        norm = await load_norm(db, request.norm_id)
 
         if not norm:
             raise HTTPException(status_code=404, detail=f"Norm with ID {request.norm_id} not found")
@@ -308,7 +443,7 @@ async def check_constitutionality(request: NormIdRequest, db: AsyncSession = Dep
             "complexity": norm.complexity
         }
     except Exception as e:
-        logging.error(f"Error checking constitutionality: {e}")
+        log.error("Error checking constitutionality: %s", e)
         raise HTTPException(status_code=500, detail="Failed to check constitutionality.")
 
 @app.post("/api/simulate_day")
@@ -335,24 +470,49 @@ async def simulate_day():
 
         society.iteration += 1
 
-        # Ensure activities exists before appending
-        if "activities" in globals():
-            activities.append(f"Day {society.iteration} progressed successfully!")
+        activity_log.record("day_passed", f"Day {society.iteration} progressed successfully!")
 
         return {"message": f"Day {society.iteration} simulated successfully!"}
     except Exception as e:
-        logging.error(f"Error simulating day: {e}")
+        log.error("Error simulating day: %s", e)
         raise HTTPException(status_code=500, detail="Failed to simulate day.")
 
+@app.post("/api/fast_forward")
+async def fast_forward(
+    days: int = Query(100, ge=1, le=1_000_000),
+    batch_days: int = Query(1000, ge=1, le=100_000),
+    start_date: Optional[datetime] = None,
+    series: bool = False,
+    db: AsyncSession = Depends(get_db)
+):
+    try:
+        if not society or society.parliament is None:
+            raise HTTPException(status_code=500, detail="`society` is not properly initialized.")
+
+        summary = await society.fast_forward(
+            db, days=days, batch_days=batch_days, start_date=start_date, series=series
+        )
+
+        activity_log.record("fast_forward", f"Fast-forwarded {days} days to day {summary['iteration']}")
+
+        snapshots.record("fast_forward", days=days, iteration=summary["iteration"])
+
+        return summary
+    except HTTPException:
+        raise
+    except Exception as e:
+        log.error("Error fast-forwarding simulation: %s", e)
+        raise HTTPException(status_code=500, detail="Failed to fast-forward simulation.")
+
 @app.post("/api/generate_citizen_cases")
-async def generate_citizen_cases(db: AsyncSession = Depends(get_db)):
+async def generate_citizen_cases(count: Optional[int] = Query(None, ge=1, le=1_000_000), db: AsyncSession = Depends(get_db)):
     try:
-        # Fetch valid norms
-        result = await db.execute(select(Norm).where(Norm.valid == True))
-        valid_norms = result.scalars().all()
+        # Fetch valid norms (only the columns needed to build cases)
+        result = await db.execute(select(Norm.id, Norm.text).where(Norm.valid == True))
+        valid_norms = result.all()
 
         if not valid_norms:
-            logging.warning("⚠️ No valid norms found.")
+            log.warning("⚠️ No valid norms found.")
             return {"message": "No valid norm to generate case.", "cases": []}
 
         # Verify citizen_pressure initialization
@@ -360,7 +520,10 @@ async def generate_citizen_cases(db: AsyncSession = Depends(get_db)):
             raise HTTPException(status_code=500, detail="`citizen_pressure` is not initialized.")
 
         # Generate cases
-        generated_cases = await society.citizen_pressure.generate_cases_from_norms(db, valid_norms)
+        generated_cases = await society.citizen_pressure.generate_cases_from_norms(db, valid_norms, count)
+        society.statistics.record_cases_created(len(generated_cases))
+        if generated_cases:
+            snapshots.record("cases_generated", count=len(generated_cases), last_id=generated_cases[-1].id)
 
         # Format response
         return {
@@ -375,96 +538,171 @@ async def generate_citizen_cases(db: AsyncSession = Depends(get_db)):
         }
     except Exception as e:
         await db.rollback()
-        logging.error(f"❌ Error generating citizen cases: {e}")
+        log.error("❌ Error generating citizen cases: %s", e)
         raise HTTPException(status_code=500, detail="Failed to generate citizen cases.")
 
+class CasePageParams:
+    """Shared keyset pagination, filter and projection parameters for the case listings."""
+
+    def __init__(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+        sort: str = Query("id", regex="^(id|created_at)$"),
+        order: str = Query("desc", regex="^(asc|desc)$"),
+        norm_id: Optional[int] = None,
+        decision: Optional[str] = Query(None, regex="^(Accepted|Rejected)$"),
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        resolved_after: Optional[datetime] = None,
+        resolved_before: Optional[datetime] = None,
+        fields: Optional[str] = None,
+    ):
+        self.cursor = cursor
+        self.limit = limit
+        self.sort = sort
+        self.order = order
+        self.norm_id = norm_id
+        self.decision = decision
+        self.created_after = created_after
+        self.created_before = created_before
+        self.resolved_after = resolved_after
+        self.resolved_before = resolved_before
+        self.fields = fields
+
+    async def fetch(self, db: AsyncSession, status: Optional[str] = None):
+        try:
+            return await fetch_case_page(
+                db,
+                status=status,
+                norm_id=self.norm_id,
+                decision=self.decision,
+                created_after=self.created_after,
+                created_before=self.created_before,
+                resolved_after=self.resolved_after,
+                resolved_before=self.resolved_before,
+                sort=self.sort,
+                order=self.order,
+                cursor=self.cursor,
+                limit=self.limit,
+                fields=self.fields,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
 @app.get("/api/get_all_cases")
-async def get_all_cases(db: AsyncSession = Depends(get_db)):
+async def get_all_cases(
+    status: Optional[str] = Query(None, regex="^(pending|solved)$"),
+    page: CasePageParams = Depends(),
+    cache: dict = Depends(generations.guard("cases")),
+    db: AsyncSession = Depends(get_db)
+):
     try:
-        # Ensure Norm is preloaded to avoid lazy-loading issues
-        result = await db.execute(select(Case).options(selectinload(Case.norm)))
-        cases = result.scalars().all()
-
-        # Format the cases for response
-        formatted_cases = [{
-            "id": case.id,
-            "text": case.text,
-            "norm_id": case.norm.id if case.norm else None,
-            "constitutional": case.constitutional,
-            "status": case.status,
-            "created_at": case.created_at.isoformat() if case.created_at else None,
-            "resolved_at": case.resolved_at.isoformat() if case.resolved_at else None,
-            "decision": case.decision if hasattr(case, "decision") else "Unknown"
-
-        } for case in cases]
-
-        return {"total": len(formatted_cases), "cases": formatted_cases}
+        cases, next_cursor = await page.fetch(db, status=status)
+        return FastJSONResponse(json_object(
+            total=len(cases), cases=dump_list(CASE_LIST, cases), next_cursor=next_cursor
+        ), headers=cache)
+    except HTTPException:
+        raise
     except Exception as e:
-        logging.error(f"Error retrieving all cases: {e}")
+        log.error("Error retrieving all cases: %s", e)
         raise HTTPException(status_code=500, detail="Failed to retrieve cases.")
 
 @app.get("/api/get_pending_cases")
-async def get_pending_cases(db: AsyncSession = Depends(get_db)):
+async def get_pending_cases(
+    page: CasePageParams = Depends(),
+    cache: dict = Depends(generations.guard("cases")),
+    db: AsyncSession = Depends(get_db)
+):
     try:
-        result = await db.execute(select(Case).filter(Case.status == "pending"))
-        pending_cases_list = result.scalars().all()
+        pending_cases_list, next_cursor = await page.fetch(db, status="pending")
 
-        # Debugging log
-        logging.info(f"📌 Returning {len(pending_cases_list)} pending cases")
+        # Per-request debugging log, sampled
+        log.debug(Event("pending_cases", returned=len(pending_cases_list)))
 
-        return {"pending_cases": pending_cases_list}  # Ensure this key matches frontend
+        return FastJSONResponse(json_object(  # Ensure this key matches frontend
+            pending_cases=dump_list(CASE_LIST, pending_cases_list), next_cursor=next_cursor
+        ), headers=cache)
+    except HTTPException:
+        raise
     except Exception as e:
-        logging.error(f"❌ Error retrieving pending cases: {e}")
+        log.error("❌ Error retrieving pending cases: %s", e)
         raise HTTPException(status_code=500, detail="Failed to retrieve pending cases.")
 
 @app.get("/api/get_solved_cases")
-async def get_solved_cases(db: AsyncSession = Depends(get_db)):
+async def get_solved_cases(
+    page: CasePageParams = Depends(),
+    cache: dict = Depends(generations.guard("cases")),
+    db: AsyncSession = Depends(get_db)
+):
     try:
-        result = await db.execute(select(Case).filter(Case.status == "solved"))
-        solved_cases_list = result.scalars().all()
-
-        # Convert cases to a list of dictionaries and ensure "decision" is included
-        solved_cases_with_decision = [
-            {
-                "id": case.id,
-                "text": case.text,
-                "norm_id": case.norm_id,
-                "created_at": case.created_at.isoformat() if case.created_at else None,
-                "resolved_at": case.resolved_at.isoformat() if case.resolved_at else "Pending",
-                "status": case.status,
-                "decision": case.decision if hasattr(case, "decision") else "Unknown"
-            }
-            for case in solved_cases_list
-        ]
-
-        # Debugging log
-        logging.info(f"📌 Returning {len(solved_cases_with_decision)} solved cases with decisions")
-
-        return {"solved_cases": solved_cases_with_decision}  # Matches frontend expectation
+        solved_cases_list, next_cursor = await page.fetch(db, status="solved")
+
+        # Keep the legacy placeholder for solved cases without a timestamp
+        for case in solved_cases_list:
+            if "resolved_at" in case and case["resolved_at"] is None:
+                case["resolved_at"] = "Pending"
+
+        # Per-request debugging log, sampled
+        log.debug(Event("solved_cases", returned=len(solved_cases_list)))
+
+        return FastJSONResponse(json_object(  # Matches frontend expectation
+            solved_cases=dump_list(CASE_LIST, solved_cases_list), next_cursor=next_cursor
+        ), headers=cache)
+    except HTTPException:
+        raise
     except Exception as e:
-        logging.error(f"❌ Error retrieving solved cases: {e}")
+        log.error("❌ Error retrieving solved cases: %s", e)
         raise HTTPException(status_code=500, detail="Failed to retrieve solved cases.")
 
+EXPORT_FETCH_SIZE = 1000
+
+def ndjson_export(query, names):
+    """Stream a query as NDJSON from its own session (request-scoped sessions close before streaming)."""
+    async def body():
+        async with SessionLocal() as session:
+            async for chunk in stream_ndjson(session, query, names, fetch_size=EXPORT_FETCH_SIZE):
+                yield chunk
+    return StreamingResponse(body(), media_type="application/x-ndjson")
+
+@app.get("/api/export/cases")
+async def export_cases(
+    status: Optional[str] = Query(None, regex="^(pending|solved)$"),
+    norm_id: Optional[int] = None,
+    fields: Optional[str] = None
+):
+    try:
+        names = parse_fields(fields, CASE_FIELDS)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    query = build_export_query(CASE_FIELDS, names, Case.id, status=status, norm_id=norm_id)
+    return ndjson_export(query, names)
+
+@app.get("/api/export/norms")
+async def export_norms(valid: Optional[bool] = None, fields: Optional[str] = None):
+    try:
+        names = parse_fields(fields, NORM_FIELDS)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    query = build_export_query(NORM_FIELDS, names, Norm.id, valid=valid)
+    return ndjson_export(query, names)
+
 @app.get("/api/get_notifications")
-async def get_notifications():
+async def get_notifications(since: Optional[int] = Query(None, ge=0), limit: Optional[int] = Query(None, ge=1)):
     try:
         # Ensure notification_manager exists
         notification_manager = globals().get("notification_manager")
         if not notification_manager:
             raise HTTPException(status_code=500, detail="Notification manager is not initialized.")
 
-        notifications = notification_manager.get_notifications()
-        return notifications
+        notifications = notification_manager.get_notifications(since, limit)
+        return FastJSONResponse(notifications)
     except Exception as e:
-        logging.error(f"Error retrieving notifications: {e}")
+        log.error("Error retrieving notifications: %s", e)
         raise HTTPException(status_code=500, detail="Failed to retrieve notifications.")
 
-@app.get("/api/get_activities")
-async def get_activities():
-    try:
-        return activities  # Return all logged activities
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+# Former name of the feed, used by the home view
+app.add_api_route("/api/get_activities", get_activities, methods=["GET"])
 
 # Define a request model for `mark_unconstitutional`
 class NormIDRequest(BaseModel):
@@ -475,39 +713,44 @@ async def mark_unconstitutional(request: NormIDRequest, db: AsyncSession = Depen
     try:
         norm_id = request.norm_id  # Extract norm_id from the request body
 
-        # Use async query for compatibility
-        result = await db.execute(select(Norm).where(Norm.id == norm_id))
-        norm = result.scalars().first()
+        norm = await load_norm(db, norm_id)
 
         if not norm:
             raise HTTPException(status_code=404, detail=f"Norm with ID {norm_id} not found")
 
+        was_valid = norm.valid
+
         # Update and commit changes
         norm.constitutional = False
         norm.valid = False
         await db.commit()
         await db.refresh(norm)  # Ensure session is updated
 
+        if was_valid and society and society.inflation:
+            society.inflation.record_norm_invalidated(norm.created_at.date() if norm.created_at else None)
+            society.statistics.record_norm_invalidated()
+        snapshots.record("norm_invalidated", id=norm_id)
+
         return {"message": f"Norm with ID {norm_id} marked as unconstitutional"}
     except Exception as e:
         try:
             await db.rollback()  # Prevent partial commits
         except Exception as rollback_error:
-            logging.error(f"Rollback failed: {rollback_error}")
+            log.error("Rollback failed: %s", rollback_error)
 
-        logging.error(f"Error marking norm as unconstitutional: {e}")
+        log.error("Error marking norm as unconstitutional: %s", e)
         raise HTTPException(status_code=500, detail="Failed to mark norm as unconstitutional.")
 
 @app.post("/api/solve_case/{case_id}")
 async def solve_case(case_id: int, decision: str = Query(..., regex="^(Accepted|Rejected)$"), db: AsyncSession = Depends(get_db)):
     try:
-        # Use select() instead of db.get() for async compatibility
-        result = await db.execute(select(Case).where(Case.id == case_id))
-        case = result.scalars().first()
+        case = await load_case(db, case_id)
 
         if not case:
             raise HTTPException(status_code=404, detail=f"Case with ID {case_id} not found")
 
+        was_pending = case.status != "solved"
+
         # Update and commit changes
         case.status = "solved"
         case.resolved_at = datetime.utcnow()  # Use UTC timestamp
@@ -516,9 +759,13 @@ async def solve_case(case_id: int, decision: str = Query(..., regex="^(Accepted|
         await db.commit()
         await db.refresh(case)  # Ensure session is updated
 
-        # Ensure activities list exists
-        activities = globals().get("activities", [])
-        activities.append(f"Solved Case #{case.id}: {case.text}")
+        if was_pending and society and society.inflation:
+            wait_seconds = (case.resolved_at - case.created_at).total_seconds() if case.created_at else 0.0
+            society.inflation.record_cases_solved(1, wait_seconds, case.resolved_at.date())
+            society.statistics.record_cases_solved(1)
+        snapshots.record("case_solved", id=case.id, decision=decision)
+
+        activity_log.record("case_solved", f"Solved Case #{case.id}: {case.text}")
 
         # Ensure notification manager exists before using it
         notification_manager = globals().get("notification_manager")
@@ -535,115 +782,212 @@ async def solve_case(case_id: int, decision: str = Query(..., regex="^(Accepted|
         try:
             await db.rollback()  # Prevent partial commits
         except Exception as rollback_error:
-            logging.error(f"Rollback failed: {rollback_error}")
+            log.error("Rollback failed: %s", rollback_error)
 
-        logging.error(f"Error solving case: {e}")
+        log.error("Error solving case: %s", e)
         raise HTTPException(status_code=500, detail="Failed to solve case.")
 
+def record_solved_cases(solved, resolved_at, decision):
+    """Fold a batch of (id, created_at) cases resolved at `resolved_at` into the running aggregates."""
+    if society and society.inflation:
+        wait_seconds = sum((resolved_at - created_at).total_seconds() for _, created_at in solved if created_at)
+        society.inflation.record_cases_solved(len(solved), wait_seconds, resolved_at.date())
+        society.statistics.record_cases_solved(len(solved))
+    snapshots.record("cases_solved", count=len(solved), decision=decision)
+
+@app.post("/api/solve_cases")
+async def solve_cases(request: SolveCasesRequest, db: AsyncSession = Depends(get_db)):
+    """Resolve a batch of cases by id or by filter with one UPDATE, one notification and one broadcast."""
+    if request.case_ids is not None and request.norm_id is not None:
+        raise HTTPException(status_code=400, detail="Provide either case_ids or norm_id, not both.")
+    if request.case_ids is not None and len(request.case_ids) > MAX_SOLVE_BATCH:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_SOLVE_BATCH} cases can be solved at once.")
+
+    try:
+        judicial_system = society.judicial_system if society and society.judicial_system else JudicialSystem()
+        solved, resolved_at, outcomes = await judicial_system.solve_cases(
+            db, request.decision, case_ids=request.case_ids, norm_id=request.norm_id, limit=request.limit
+        )
+    except Exception as e:
+        try:
+            await db.rollback()
+        except Exception as rollback_error:
+            log.error("Rollback failed: %s", rollback_error)
+        log.error("Error solving cases: %s", e)
+        raise HTTPException(status_code=500, detail="Failed to solve cases.")
+
+    solved_ids = [case_id for case_id, _ in solved]
+    if solved_ids:
+        record_solved_cases(solved, resolved_at, request.decision)
+        activity_log.record("cases_solved", f"Solved {len(solved_ids)} cases as {request.decision}")
+        notification_manager.add_notification(f"{len(solved_ids)} cases have been solved as {request.decision}.")
+        await socket_manager.emit('cases_solved', {'case_ids': solved_ids, 'decision': request.decision})
+
+    return {
+        "message": f"Solved {len(solved_ids)} cases as {request.decision}",
+        "solved": len(solved_ids),
+        "outcomes": [{"id": case_id, "outcome": outcome} for case_id, outcome in outcomes.items()],
+    }
+
+def adjudication_pool():
+    if not society or not society.judicial_system:
+        raise HTTPException(status_code=503, detail="Society is not initialized.")
+    return society.judicial_system.adjudication
+
+@app.post("/api/adjudication/start")
+async def start_adjudication(
+    workers: Optional[int] = Query(None, ge=1, le=256),
+    batch_size: Optional[int] = Query(None, ge=1, le=MAX_SOLVE_BATCH),
+    service_time: Optional[float] = Query(None, ge=0),
+):
+    """Start auto-adjudication of pending cases; service_time is seconds per complexity point."""
+    pool = adjudication_pool()
+    if pool.running:
+        raise HTTPException(status_code=409, detail="Auto-adjudication is already running.")
+    pool.start(SessionLocal, record_solved_cases, workers=workers, batch_size=batch_size, service_time=service_time)
+    activity_log.record("adjudication_started", f"Auto-adjudication started with {pool.size} workers")
+    return pool.stats()
+
+@app.post("/api/adjudication/stop")
+async def stop_adjudication():
+    pool = adjudication_pool()
+    await pool.stop()
+    activity_log.record("adjudication_stopped", "Auto-adjudication stopped")
+    return pool.stats()
+
+@app.post("/api/adjudication/resize")
+async def resize_adjudication(workers: int = Query(..., ge=0, le=256)):
+    pool = adjudication_pool()
+    pool.resize(workers)
+    return pool.stats()
+
+@app.get("/api/adjudication/status")
+async def adjudication_status():
+    return adjudication_pool().stats()
+
 @app.get("/api/get_all_norms", response_model=List[NormResponse])
-async def get_all_norms(db: AsyncSession = Depends(get_db)):
+async def get_all_norms(cache: dict = Depends(generations.guard("norms")), db: AsyncSession = Depends(get_db)):
     try:
-        # Ensure relationships (like cases) are loaded to prevent lazy-loading issues
-        result = await db.execute(select(Norm).options(selectinload(Norm.cases)))
-        norm_list = result.scalars().all()
-        return norm_list
+        # Column-only select; NormResponse never includes cases
+        return FastJSONResponse(dump_list(NORM_LIST, await fetch_norm_rows(db)), headers=cache)
     except Exception as e:
-        logging.error(f"Error retrieving norms: {e}")
+        log.error("Error retrieving norms: %s", e)
         raise HTTPException(status_code=500, detail="Failed to retrieve norms.")
 
 @app.get("/api/get_valid_norms", response_model=List[NormResponse])
-async def get_valid_norms(db: AsyncSession = Depends(get_db)):
+async def get_valid_norms(cache: dict = Depends(generations.guard("norms")), db: AsyncSession = Depends(get_db)):
     try:
-        # Ensure relationships (like cases) are loaded to prevent lazy-loading issues
-        result = await db.execute(select(Norm).options(selectinload(Norm.cases)).filter(Norm.valid == True))
-        valid_norms_list = result.scalars().all()
-        return valid_norms_list
+        return FastJSONResponse(dump_list(NORM_LIST, await fetch_norm_rows(db, valid=True)), headers=cache)
     except Exception as e:
-        logging.error(f"Error retrieving valid norms: {e}")
+        log.error("Error retrieving valid norms: %s", e)
         raise HTTPException(status_code=500, detail="Failed to retrieve valid norms.")
 
 @app.get("/api/get_invalid_norms", response_model=List[NormResponse])
-async def get_invalid_norms(db: AsyncSession = Depends(get_db)):
+async def get_invalid_norms(cache: dict = Depends(generations.guard("norms")), db: AsyncSession = Depends(get_db)):
     try:
-        # Ensure relationships (like cases) are loaded to prevent lazy-loading issues
-        result = await db.execute(select(Norm).options(selectinload(Norm.cases)).filter(Norm.valid == False))
-        invalid_norms_list = result.scalars().all()
-        return invalid_norms_list
+        return FastJSONResponse(dump_list(NORM_LIST, await fetch_norm_rows(db, valid=False)), headers=cache)
     except Exception as e:
-        logging.error(f"Error retrieving invalid norms: {e}")
+        log.error("Error retrieving invalid norms: %s", e)
         raise HTTPException(status_code=500, detail="Failed to retrieve invalid norms.")
 
 @app.get("/api/get_statistics")
 async def get_statistics(db: AsyncSession = Depends(get_db)):
     try:
-        # Optimize Norms query: Fetch all counts in one query
-        norm_counts = await db.execute(
-            select(
-                func.count(Norm.id),
-                func.count().filter(Norm.valid == True),
-                func.count().filter(Norm.valid == False),
-            )
-        )
-        total_norms, valid_norms, invalid_norms = norm_counts.one()
-
-        # Optimize Cases query: Fetch all counts in one query
-        case_counts = await db.execute(
-            select(
-                func.count(Case.id),
-                func.count().filter(Case.status == "pending"),
-                func.count().filter(Case.status == "solved"),
-            )
-        )
-        total_cases, pending_cases, solved_cases = case_counts.one()
-
-        # Prepare optimized statistics
-        stats = {
-            "norms": {
-                "total": total_norms,
-                "valid": valid_norms,
-                "invalid": invalid_norms
-            },
-            "cases": {
-                "total": total_cases,
-                "pending": pending_cases,
-                "solved": solved_cases
-            }
-        }
-        return stats
+        # Served from the in-process cache; write endpoints keep it current
+        statistics = society.statistics
+        if not statistics.seeded:
+            await statistics.update_counts(db)
+        return statistics.to_statistics()
     except Exception as e:
-        logging.error(f"Error retrieving statistics: {e}")
+        log.error("Error retrieving statistics: %s", e)
         raise HTTPException(status_code=500, detail="Failed to retrieve statistics.")
 
+@app.get("/api/get_case_decisions")
+async def get_case_decisions(cache: dict = Depends(generations.guard("cases")), db: AsyncSession = Depends(get_db)):
+    """Accepted / rejected totals and solved cases per day, aggregated in SQL for the dashboard."""
+    try:
+        return FastJSONResponse(await case_decision_summary(db), headers=cache)
+    except Exception as e:
+        log.error("Error retrieving case decisions: %s", e)
+        raise HTTPException(status_code=500, detail="Failed to retrieve case decisions.")
+
+@app.get("/api/dashboard_snapshot")
+async def dashboard_snapshot(db: AsyncSession = Depends(get_db)):
+    try:
+        if society and not society.statistics.seeded:
+            await society.statistics.update_counts(db)
+        return snapshots.latest()
+    except Exception as e:
+        log.error("Error retrieving dashboard snapshot: %s", e)
+        raise HTTPException(status_code=500, detail="Failed to retrieve dashboard snapshot.")
+
 @app.get("/api/get_normative_inflation")
 async def get_normative_inflation(db: AsyncSession = Depends(get_db)):
     try:
-        # Create an instance of NormativeInflationModel
-        model = NormativeInflationModel()
+        # The society-owned model keeps running aggregates, so this is O(1) after the first call
+        model = society.inflation if society and society.inflation else NormativeInflationModel()
 
         # Call the instance method
         inflation_data = await model.calculate_inflation(db)
 
         return JSONResponse(content={"inflation_data": inflation_data})
     except Exception as e:
-        logging.error(f"Error retrieving normative inflation: {e}")
+        log.error("Error retrieving normative inflation: %s", e)
         return JSONResponse(content={"error": "Failed to retrieve normative inflation"}, status_code=500)
 
-@app.get("/{full_path:path}")
-async def serve_vue(full_path: str):
-    """Serve Vue's frontend while handling history mode"""
-    
-    requested_file = frontend_path / full_path
+@app.get("/api/inflation_projection")
+async def inflation_projection(
+    horizon: int = Query(365, ge=1, le=3650),
+    scenarios: int = Query(1000, ge=1, le=10000),
+    norm_rate: Optional[float] = Query(None, ge=0),
+    processing_rate: Optional[float] = Query(None, ge=0),
+    seed: Optional[int] = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """Monte Carlo what-if projection of the backlog, seeded with the real daily history."""
+    try:
+        # NumPy is only imported by the first projection, not at every cold start
+        import numpy as np
+        from backend.models.projections import project_from_history, summarize as summarize_projection
+
+        history, projection = await project_from_history(
+            db, horizon=horizon, scenarios=scenarios, norm_rate=norm_rate, processing_rate=processing_rate, seed=seed
+        )
+        band = np.percentile(projection["backlog"], [5, 50, 95], axis=0).round(2)
+        return {
+            "history_days": len(history["days"]),
+            "norm_rate": round(history["norm_rate"], 3),
+            "processing_rate": round(history["processing_rate"], 3),
+            "final": summarize_projection(projection),
+            "backlog": {"p5": band[0].tolist(), "p50": band[1].tolist(), "p95": band[2].tolist()},
+        }
+    except Exception as e:
+        log.error("Error projecting normative inflation: %s", e)
+        raise HTTPException(status_code=500, detail="Failed to project normative inflation.")
+
+@app.get("/api/debug/pool")
+async def debug_pool():
+    return pool_status()
+
+@app.get("/api/debug/websockets")
+async def debug_websockets():
+    return broadcaster.stats()
+
+@app.get("/api/metrics")
+async def get_metrics():
+    """Prometheus text exposition of request, SQL and connection metrics."""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+@app.api_route("/{full_path:path}", methods=["GET", "HEAD"])
+async def serve_vue(full_path: str, request: Request):
+    """Serve Vue's frontend from the startup manifest, handling history mode"""
 
     # 🔴 1. Serve API routes normally (prevent Vue from hijacking them)
     if full_path.startswith("api/"):
         return JSONResponse(status_code=404, content={"detail": "API Not Found"})
 
-    # 🟢 2. Serve static files (JS, CSS, images)
-    if requested_file.exists() and requested_file.is_file():
-        return FileResponse(requested_file)
-
-    # 🔵 3. Redirect all other routes to Vue's `index.html`
-    return FileResponse(frontend_path / "index.html")
+    # 🟢 2. Static files (JS, CSS, images), 🔵 3. everything else gets Vue's `index.html`
+    return resources.static.respond(full_path, request.headers, request.method)
 
 if __name__ == "__main__":
     import uvicorn
@@ -4,6 +4,7 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import AsyncEngine
 import asyncio
+import logging
 
 Base = declarative_base()
 
@@ -20,10 +21,10 @@ def register_models(engine):
     # Ensure models are added to Base.metadata
     if isinstance(engine, AsyncEngine):
         # Async engine - can't use directly with Alembic
-        print("Using Async Engine, cannot apply migrations directly with Alembic.")
+        logging.debug("Using Async Engine, cannot apply migrations directly with Alembic.")
     else:
         # Synchronous engine - used with Alembic
-        print("Using Sync Engine, applying migrations directly.")
+        logging.debug("Using Sync Engine, applying migrations directly.")
         Base.metadata.create_all(bind=engine)
 
     return Base.metadata
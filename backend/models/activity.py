@@ -1,7 +1,17 @@
 #models/activity.py
 
-from sqlalchemy import Column, Integer, String, DateTime, func
-from database import Base
+import asyncio
+from collections import deque
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime, func, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from backend.models import Base
+from backend.models.logs import get_logger
+
+log = get_logger("activity")
+
+ACTIVITY_COLUMNS = ("id", "name", "description", "created_at")
 
 class Activity(Base):
     __tablename__ = "activities"
@@ -10,3 +20,136 @@ class Activity(Base):
     name = Column(String, nullable=False)
     description = Column(String, nullable=True)
     created_at = Column(DateTime, default=func.now(), nullable=False)
+
+
+class ActivityLog:
+    """
+    Recent activities kept in a bounded ring buffer and written behind to the `activities`
+    table in batches of `flush_size` or every `flush_interval` seconds.
+    Ids come from the database (INSERT ... RETURNING): an entry has `id` None until its
+    batch is inserted, and the feed pages through memory and the table by that id.
+    """
+
+    def __init__(self, capacity=1000, flush_size=100, flush_interval=2.0, flush_attempts=3):
+        self.capacity = capacity
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.flush_attempts = flush_attempts  # A batch failing this many times in a row is dropped
+        self.buffer = deque(maxlen=capacity)
+        self.pending = []           # Recorded but not yet inserted
+        self.dropped = 0            # Unpersisted entries discarded while the database was failing
+        self.failures = 0           # Consecutive failed flushes
+        self.session_factory = None
+        self._flush_task = None
+        self._flush_requested = None
+
+    def record(self, name, description=None):
+        """Log an activity in memory and queue it for the next batched INSERT."""
+        entry = {
+            "id": None,
+            "name": name,
+            "description": description,
+            "created_at": datetime.utcnow(),
+        }
+        self.buffer.append(entry)
+        self.pending.append(entry)
+        if len(self.pending) > self.capacity * 10:
+            # Keep memory bounded if the database stays unavailable
+            self.dropped += len(self.pending) - self.capacity * 10
+            del self.pending[:-self.capacity * 10]
+        if len(self.pending) >= self.flush_size and self._flush_requested is not None:
+            self._flush_requested.set()
+        return entry
+
+    async def page(self, session: AsyncSession, limit=50, before=None):
+        """
+        Newest-first activities with an id below `before`; the first page also holds the
+        entries not inserted yet (id None).
+        Served from the ring buffer while it reaches back far enough, then from the table.
+        """
+        entries = [
+            entry for entry in reversed(self.buffer)
+            if before is None or (entry["id"] is not None and entry["id"] < before)
+        ][:limit]
+        if len(entries) < limit:
+            persisted = [entry["id"] for entry in entries if entry["id"] is not None]
+            oldest = persisted[-1] if persisted else before
+            query = select(Activity.id, Activity.name, Activity.description, Activity.created_at)
+            if oldest is not None:
+                query = query.where(Activity.id < oldest)
+            result = await session.execute(query.order_by(Activity.id.desc()).limit(limit - len(entries)))
+            entries += [dict(zip(ACTIVITY_COLUMNS, row)) for row in result.all()]
+        return entries
+
+    async def flush(self):
+        """Insert queued activities with one executemany and take the ids the database assigned."""
+        if not self.pending or self.session_factory is None:
+            return
+        batch, self.pending = self.pending, []
+        rows = [{"name": e["name"], "description": e["description"], "created_at": e["created_at"]} for e in batch]
+        try:
+            async with self.session_factory() as session:
+                result = await session.execute(
+                    insert(Activity).returning(Activity.id, sort_by_parameter_order=True), rows
+                )
+                ids = result.scalars().all()
+                await session.commit()
+        except Exception as e:
+            self.failures += 1
+            if self.failures < self.flush_attempts:
+                log.error("Failed to save activities (attempt %s): %s", self.failures, e)
+                self.pending = batch + self.pending
+                return
+            # Give up on this batch rather than retrying it forever
+            log.error("❌ Dropping %s activities after %s failed saves: %s", len(batch), self.failures, e)
+            self.failures = 0
+            self.dropped += len(batch)
+            unsaved = {id(entry) for entry in batch}
+            kept = [entry for entry in self.buffer if id(entry) not in unsaved]
+            self.buffer.clear()
+            self.buffer.extend(kept)
+            return
+        self.failures = 0
+        for entry, activity_id in zip(batch, ids):
+            entry["id"] = activity_id
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            await self.flush()
+
+    async def start(self, session_factory):
+        """Load the ring buffer from the table, then start the background flush task."""
+        self.session_factory = session_factory
+        try:
+            async with session_factory() as session:
+                result = await session.execute(
+                    select(Activity.id, Activity.name, Activity.description, Activity.created_at)
+                    .order_by(Activity.id.desc())
+                    .limit(self.capacity)
+                )
+                recent = [dict(zip(ACTIVITY_COLUMNS, row)) for row in result.all()]
+        except Exception as e:
+            log.error("Failed to load recent activities: %s", e)
+            recent = []
+        # Entries recorded before start are newer than the persisted ones
+        early = list(self.buffer)
+        self.buffer.clear()
+        self.buffer.extend(reversed(recent))
+        self.buffer.extend(early)
+        if self._flush_task is None:
+            self._flush_requested = asyncio.Event()
+            self._flush_task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the flush task and persist whatever is still queued."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+            self._flush_requested = None
+        await self.flush()
@@ -1,15 +1,17 @@
 #models/analysis.py
 
-import logging
+import asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.sql import extract
-from sqlalchemy import func
+from sqlalchemy import func, true
 from backend.models.case import Case
 from backend.models.norm import Norm
-from datetime import datetime
+from datetime import date, datetime
+from backend.models.logs import get_logger
+
+log = get_logger("analysis")
 
-logging.basicConfig(level=logging.DEBUG, format="%(message)s")
 
 class Counter:
     def __init__(self):
@@ -20,17 +22,63 @@ class Counter:
         self.total_norms = 0
         self.valid_norms = 0
         self.invalid_norms = 0
+        self.seeded = False
 
     async def update_counts(self, session: AsyncSession):
-        """Fetch and update the latest counts from the database asynchronously."""
-        async with session.begin():
-            self.total_cases = await session.scalar(select(func.count(Case.id)))
-            self.solved_cases = await session.scalar(select(func.count(Case.id)).filter_by(status="solved"))
-            self.pending_cases = await session.scalar(select(func.count(Case.id)).filter_by(status="pending"))
+        """Fetch and update the latest counts from the database in a single query."""
+        norm_counts = select(
+            func.count(Norm.id).label("total"),
+            func.count().filter(Norm.valid == True).label("valid"),
+            func.count().filter(Norm.valid == False).label("invalid"),
+        ).subquery()
+        case_counts = select(
+            func.count(Case.id).label("total"),
+            func.count().filter(Case.status == "solved").label("solved"),
+            func.count().filter(Case.status == "pending").label("pending"),
+        ).subquery()
+
+        result = await session.execute(
+            select(
+                norm_counts.c.total, norm_counts.c.valid, norm_counts.c.invalid,
+                case_counts.c.total, case_counts.c.solved, case_counts.c.pending,
+            ).select_from(norm_counts.join(case_counts, true()))
+        )
+        (
+            self.total_norms, self.valid_norms, self.invalid_norms,
+            self.total_cases, self.solved_cases, self.pending_cases,
+        ) = result.one()
+        self.seeded = True
+
+    async def reconcile_forever(self, session_factory, interval=300):
+        """Periodically recount from the database to correct any drift of the in-place updates."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with session_factory() as session:
+                    await self.update_counts(session)
+                log.info("Statistics cache reconciled with the database.")
+            except Exception as e:
+                log.error("Failed to reconcile statistics cache: %s", e)
+
+    def record_norms_created(self, count=1):
+        """Account for `count` new valid norms."""
+        self.total_norms += count
+        self.valid_norms += count
+
+    def record_norm_invalidated(self):
+        """Account for a valid norm marked unconstitutional."""
+        self.valid_norms = max(0, self.valid_norms - 1)
+        self.invalid_norms += 1
 
-            self.total_norms = await session.scalar(select(func.count(Norm.id)))
-            self.valid_norms = await session.scalar(select(func.count(Norm.id)).filter_by(valid=True))
-            self.invalid_norms = await session.scalar(select(func.count(Norm.id)).filter_by(valid=False))
+    def record_cases_created(self, count=1):
+        """Account for `count` new pending cases."""
+        self.total_cases += count
+        self.pending_cases += count
+
+    def record_cases_solved(self, count=1):
+        """Account for `count` pending cases that were solved."""
+        self.pending_cases = max(0, self.pending_cases - count)
+        self.solved_cases += count
 
     def to_dict(self):
         """Return a dictionary of all counts for API responses."""
@@ -44,6 +92,85 @@ class Counter:
             "resolution_rate": round((self.solved_cases / self.total_cases * 100) if self.total_cases else 0, 1),
         }
 
+    def to_statistics(self):
+        """Return the counts in the nested format of /api/get_statistics."""
+        return {
+            "norms": {
+                "total": self.total_norms,
+                "valid": self.valid_norms,
+                "invalid": self.invalid_norms
+            },
+            "cases": {
+                "total": self.total_cases,
+                "pending": self.pending_cases,
+                "solved": self.solved_cases
+            }
+        }
+
+
+def waiting_seconds(dialect_name):
+    """SQL expression for the seconds between a case's creation and its resolution."""
+    if dialect_name == "sqlite":
+        return (func.julianday(Case.resolved_at) - func.julianday(Case.created_at)) * 86400
+    return extract("epoch", Case.resolved_at - Case.created_at)
+
+
+def as_date(value):
+    """Normalize a func.date() result (date on PostgreSQL, string on SQLite)."""
+    if value is None or isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value))
+
+
+def norms_per_day_query():
+    """Valid norms created per day."""
+    return (
+        select(func.date(Norm.created_at), func.count(Norm.id))
+        .filter(Norm.valid == True)
+        .group_by(func.date(Norm.created_at))
+    )
+
+
+def solved_per_day_query():
+    """Cases resolved per day."""
+    return (
+        select(func.date(Case.resolved_at), func.count(Case.id))
+        .filter(Case.status == "solved")
+        .group_by(func.date(Case.resolved_at))
+    )
+
+
+def decision_counts_query():
+    """Solved cases per decision."""
+    return select(Case.decision, func.count(Case.id)).filter(Case.status == "solved").group_by(Case.decision)
+
+
+async def case_decision_summary(session: AsyncSession):
+    """Accepted / rejected counts and solved cases per day, for the dashboard charts."""
+    decisions = {"Accepted": 0, "Rejected": 0}
+    result = await session.execute(decision_counts_query())
+    for decision, count in result.all():
+        if decision is not None:
+            decisions[getattr(decision, "value", decision)] = count
+
+    result = await session.execute(solved_per_day_query())
+    timeline = sorted(
+        (as_date(day), count) for day, count in result.all() if day is not None
+    )
+    return {
+        "decisions": decisions,
+        "timeline": [{"date": day.isoformat(), "solved": count} for day, count in timeline],
+    }
+
+
+def waiting_time_query(dialect_name):
+    """Count and summed waiting seconds of the solved cases with both timestamps."""
+    return (
+        select(func.count(Case.id), func.sum(waiting_seconds(dialect_name)))
+        .filter(Case.status == "solved")
+        .filter(Case.resolved_at.isnot(None), Case.created_at.isnot(None))
+    )
+
 
 class NormativeInflationModel:
     def __init__(self):
@@ -53,56 +180,99 @@ class NormativeInflationModel:
         self.backlog = 0            # Accumulated unprocessed norms
         self.temporal_gap = 0       # Average delay between norm creation & judicial processing
 
+        # Running aggregates, seeded from SQL once and then maintained by the write paths
+        self.seeded = False
+        self.current_day = None     # Latest day with activity
+        self.day_norms = 0          # Valid norms created on current_day
+        self.day_solved = 0         # Cases solved on current_day
+        self.closed_backlog = 0     # Backlog folded over every day before current_day
+        self.solved_count = 0       # Solved cases with both timestamps
+        self.total_wait_seconds = 0.0
+
     async def calculate_daily_metrics(self, session: AsyncSession):
         """Calculate daily metrics for norms and cases."""
-        async with session.begin():
-            # Count norms created per day
-            norms_per_day = await session.execute(
-                select(extract("day", Norm.created_at), func.count(Norm.id))
-                .filter(Norm.valid == True)
-                .group_by(extract("day", Norm.created_at))
-            )
-            norms_per_day = dict(norms_per_day.fetchall())
-
-            # Count cases resolved per day
-            cases_per_day = await session.execute(
-                select(extract("day", Case.resolved_at), func.count(Case.id))
-                .filter(Case.status == "solved")
-                .group_by(extract("day", Case.resolved_at))
-            )
-            cases_per_day = dict(cases_per_day.fetchall())
-
-            return norms_per_day, cases_per_day
+        # Count norms created per day
+        norms_per_day = await session.execute(norms_per_day_query())
+        norms_per_day = {as_date(day): count for day, count in norms_per_day.all()}
 
-    async def update_metrics(self, session: AsyncSession):
-        """Fetch and compute the refined normative inflation metrics safely."""
+        # Count cases resolved per day
+        cases_per_day = await session.execute(solved_per_day_query())
+        cases_per_day = {as_date(day): count for day, count in cases_per_day.all()}
+
+        return norms_per_day, cases_per_day
+
+    async def refresh(self, session: AsyncSession):
+        """Rebuild the running aggregates from SQL aggregates (one grouped query per table)."""
         norms_per_day, cases_per_day = await self.calculate_daily_metrics(session)
 
-        # Remove None values from keys before computing max()
-        valid_days = {day for day in norms_per_day.keys() | cases_per_day.keys() if day is not None}
+        # Fold B_t = max(0, B_{t-1} + ND_t - PR_t) over every closed day
+        days = sorted(day for day in norms_per_day.keys() | cases_per_day.keys() if day is not None)
+        backlog = 0
+        for day in days[:-1]:
+            backlog = max(0, backlog + norms_per_day.get(day, 0) - cases_per_day.get(day, 0))
 
-        if valid_days:
-            latest_day = max(valid_days)  # Ensure only valid days are considered
-            self.normative_density = norms_per_day.get(latest_day, 0)
-            self.processing_rate = cases_per_day.get(latest_day, 0)
-        else:
-            self.normative_density = 0
-            self.processing_rate = 0
+        self.closed_backlog = backlog
+        self.current_day = days[-1] if days else None
+        self.day_norms = norms_per_day.get(self.current_day, 0)
+        self.day_solved = cases_per_day.get(self.current_day, 0)
 
-        # Update backlog: B_t = B_{t-1} + (ND_t - PR_t)
-        self.backlog = max(0, self.backlog + (self.normative_density - self.processing_rate))
+        # Temporal gap: pushed down to SUM/COUNT instead of loading solved cases
+        result = await session.execute(waiting_time_query(session.get_bind().dialect.name))
+        solved_count, total_wait = result.one()
+        self.solved_count = solved_count or 0
+        self.total_wait_seconds = float(total_wait or 0)
+        self.seeded = True
+
+    def _advance_to(self, day):
+        """Close the current day when activity is recorded on a later one."""
+        if self.current_day is None:
+            self.current_day = day
+        elif day > self.current_day:
+            self.closed_backlog = max(0, self.closed_backlog + self.day_norms - self.day_solved)
+            self.current_day = day
+            self.day_norms = 0
+            self.day_solved = 0
+        return day == self.current_day
+
+    def record_norms(self, count=1, day=None):
+        """Account for `count` new valid norms."""
+        if self._advance_to(day or datetime.utcnow().date()):
+            self.day_norms += count
+
+    def record_norm_invalidated(self, created_day=None):
+        """
+        Account for a norm that stopped being valid.
+        A norm of the current day is taken off its counter. One from an earlier day changes
+        the clamped backlog fold, which can't be patched in place, so the aggregates are
+        marked stale and rebuilt by the next `update_metrics`.
+        """
+        if created_day is None:
+            return  # Undated norms never entered the daily fold
+        if created_day == self.current_day:
+            self.day_norms = max(0, self.day_norms - 1)
+        elif self.current_day is None or created_day < self.current_day:
+            self.seeded = False
 
-        # Compute Temporal Gap safely
-        result = await session.execute(select(Case).filter(Case.status == "solved"))
-        processed_cases = result.scalars().all()
+    def record_cases_solved(self, count=1, wait_seconds=0.0, day=None):
+        """Account for `count` solved cases that waited `wait_seconds` in total."""
+        if self._advance_to(day or datetime.utcnow().date()):
+            self.day_solved += count
+        self.solved_count += count
+        self.total_wait_seconds += wait_seconds
 
-        valid_cases = [case for case in processed_cases if case.resolved_at and case.created_at]
+    async def update_metrics(self, session: AsyncSession):
+        """Derive the refined normative inflation metrics from the running aggregates."""
+        if not self.seeded:
+            await self.refresh(session)
+
+        self.normative_density = self.day_norms
+        self.processing_rate = self.day_solved
+
+        # Update backlog: B_t = B_{t-1} + (ND_t - PR_t)
+        self.backlog = max(0, self.closed_backlog + (self.normative_density - self.processing_rate))
 
-        if valid_cases:
-            total_waiting_time = sum(
-                (case.resolved_at - case.created_at).total_seconds() / 3600 for case in valid_cases
-            )
-            self.temporal_gap = round(total_waiting_time / len(valid_cases), 2)
+        if self.solved_count:
+            self.temporal_gap = round(self.total_wait_seconds / self.solved_count / 3600, 2)
         else:
             self.temporal_gap = 0
 
@@ -119,7 +289,7 @@ class NormativeInflationModel:
             return result
         
         except Exception as e:
-            logging.error(f"Error calculating normative inflation: {e}", exc_info=True)
+            log.error("Error calculating normative inflation: %s", e, exc_info=True)
             return {
                 "normative_density": 0,
                 "processing_rate": 0,
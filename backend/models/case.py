@@ -1,16 +1,17 @@
 #case.py
 
-import logging
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, select
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Index, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from backend.models import Base
 from sqlalchemy import Enum as SQLAEnum
 from enum import Enum
+from backend.models.logs import get_logger
+
+log = get_logger("judicial")
 
-logging.basicConfig(level=logging.DEBUG, format="%(message)s")
 
 class DecisionEnum(str, Enum): # 
     ACCEPTED = "Accepted"
@@ -28,7 +29,16 @@ class Case(Base):
     resolved_at = Column(DateTime, nullable=True)
     decision = Column(SQLAEnum(DecisionEnum, name="decision_enum"), nullable=True)
 
-    norm = relationship("Norm", back_populates="cases", lazy="selectin")
+    norm = relationship("Norm", back_populates="cases", lazy="raise_on_sql")  # Load explicitly when needed
+
+    # Match the hot access paths: status/norm listings keyed on id, created_at keyset pages,
+    # and per-day grouping of solved cases
+    __table_args__ = (
+        Index("ix_cases_status_id", "status", "id"),
+        Index("ix_cases_norm_id_id", "norm_id", "id"),
+        Index("ix_cases_created_at_id", "created_at", "id"),
+        Index("ix_cases_status_resolved_at", "status", "resolved_at"),
+    )
 
     def to_dict(self):
         return {
@@ -54,5 +64,5 @@ class Case(Base):
         self.resolved_at = datetime.utcnow()
         self.status = "solved"
         await session.commit()
-        logging.info(f"Case {self.id}: Resolved with decision {'Constitutional' if decision else 'Unconstitutional'}")
+        log.info("Case %s: Resolved with decision %s", self.id, 'Constitutional' if decision else 'Unconstitutional')
 
@@ -1,18 +1,21 @@
 #citizen_pressure.py
 
 import random
-import logging
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from backend.models.case import Case
+from backend.models.norm import Norm
+from backend.models.logs import get_logger
+
+log = get_logger("citizens")
 
-logging.basicConfig(level=logging.DEBUG, format="%(message)s")
 
 class CitizenPressure:
-    def __init__(self, judicial_system, political_system):
+    def __init__(self, judicial_system, political_system, daily_case_count=5):
         self.judicial_system = judicial_system
         self.political_system = political_system
-        self.daily_case_count = 5
+        self.daily_case_count = daily_case_count
         self.case_types = [
             "Environmental Concern",
             "Civil Rights Issue",
@@ -21,53 +24,69 @@ class CitizenPressure:
             "Public Safety Concern"
         ]
 
-    async def generate_daily_cases(self, session: AsyncSession):
+    @staticmethod
+    def as_targets(valid_norms):
+        """Normalize Norm objects or (id, text) rows into a list of (id, text) tuples."""
+        return [(norm.id, norm.text) if isinstance(norm, Norm) else tuple(norm) for norm in valid_norms]
+
+    def build_case_rows(self, targets, count):
         """
-        Generate a fixed number of daily cases from valid norms.
-        Ensure cases are committed to the database and added to pending cases.
+        Build plain insert rows for `count` citizen cases.
+        `targets` is a sequence of (id, text) pairs (see `as_targets`); it is only sampled,
+        so callers can keep one growing list across days.
         """
-        generated_cases = []
-        valid_norms = await self.political_system.get_valid_norms(session)
+        if not targets:
+            return []
+        return [
+            {
+                "text": f"Citizen Petition: {case_type} regarding norm {norm_text}",
+                "norm_id": norm_id,
+                "constitutional": True,
+                "status": "pending",
+            }
+            for (norm_id, norm_text), case_type in zip(
+                random.choices(targets, k=count), random.choices(self.case_types, k=count)
+            )
+        ]
 
-        if not valid_norms:
-            logging.info("No valid norm to generate case.")
+    async def bulk_insert_cases(self, session: AsyncSession, valid_norms, count):
+        """
+        Insert `count` cases with set-based multi-row INSERT ... RETURNING statements.
+        Returns lightweight rows (id, text, norm_id) instead of hydrated Case objects.
+        """
+        rows = self.build_case_rows(self.as_targets(valid_norms), count)
+        if not rows:
             return []
 
-        for _ in range(self.daily_case_count):
-            norm = random.choice(valid_norms)
-            case_type = random.choice(self.case_types)
+        result = await session.execute(
+            insert(Case).returning(Case.id, Case.text, Case.norm_id),
+            rows
+        )
+        return result.all()
 
-            case = Case(
-                text=f"Citizen Petition: {case_type} regarding norm {norm.text}",
-                norm_id=norm.id
-            )
+    async def generate_daily_cases(self, session: AsyncSession, count=None):
+        """
+        Generate `count` (default `daily_case_count`) cases from valid norms.
+        Ensure cases are committed to the database.
+        """
+        result = await session.execute(select(Norm.id, Norm.text).where(Norm.valid == True))
+        valid_norms = result.all()
 
-            session.add(case)  # Persist to database
-            self.judicial_system.pending_cases.append(case)  # Ensure added to pending cases
-            generated_cases.append(case)
+        if not valid_norms:
+            log.info("No valid norm to generate case.")
+            return []
 
+        generated_cases = await self.bulk_insert_cases(session, valid_norms, count or self.daily_case_count)
         await session.commit()  # Commit all cases at once
-        logging.info(f"✅ Generated {len(generated_cases)} citizen pressure cases.")
+        log.info("✅ Generated %s citizen pressure cases.", len(generated_cases))
         return generated_cases
 
-    async def generate_cases_from_norms(self, session: AsyncSession, valid_norms):
-        """Generates and saves cases based on the provided valid norms."""
-        generated_cases = []
-
+    async def generate_cases_from_norms(self, session: AsyncSession, valid_norms, count=None):
+        """Generates and saves `count` (default `daily_case_count`) cases based on the provided valid norms."""
         if not valid_norms:
-            logging.info("No valid norm to generate case.")
+            log.info("No valid norm to generate case.")
             return []
 
-        for _ in range(self.daily_case_count):
-            norm = random.choice(valid_norms)
-            case_type = random.choice(self.case_types)
-            case = Case(
-                text=f"Citizen Petition: {case_type} regarding norm {norm.text}",
-                norm_id=norm.id,
-                constitutional=True
-            )
-            session.add(case)  # ✅ Ensure case is added to session
-            generated_cases.append(case)
-
+        generated_cases = await self.bulk_insert_cases(session, valid_norms, count or self.daily_case_count)
         await session.commit()  # ✅ Commit all cases at once
         return generated_cases
@@ -0,0 +1,99 @@
+#models/dashboard.py
+
+import time
+import asyncio
+from collections import deque
+from datetime import datetime
+from backend.models.logs import get_logger
+
+log = get_logger("dashboard")
+
+
+class SnapshotPublisher:
+    """
+    Push compact dashboard snapshots to subscribers when data changes.
+    Write paths call `record` with a small description of what changed; at most one
+    snapshot per `min_interval` seconds is emitted, carrying the current statistics
+    and the changes accumulated since the previous snapshot.
+    """
+
+    def __init__(self, statistics_source, min_interval=1.0, max_changes=50):
+        self.statistics_source = statistics_source  # Callable returning the Counter cache
+        self.min_interval = min_interval
+        self.max_changes = max_changes
+        self.emitters = []          # Async callables taking (event, payload)
+        self.changes = deque()
+        self.dropped_changes = 0
+        self.seq = 0
+        self.last_published = 0.0
+        self._scheduled = None
+
+    def add_emitter(self, emitter):
+        self.emitters.append(emitter)
+
+    def record(self, kind, **data):
+        """Note a change and schedule a debounced snapshot."""
+        if len(self.changes) >= self.max_changes:
+            self.changes.popleft()
+            self.dropped_changes += 1
+        self.changes.append({"kind": kind, **data})
+        self._schedule()
+
+    def _schedule(self):
+        if self._scheduled is not None and not self._scheduled.done():
+            return
+        try:
+            self._scheduled = asyncio.get_running_loop().create_task(self._publish_later())
+        except RuntimeError:
+            pass  # No running loop (e.g. scripts); the next snapshot picks the change up
+
+    async def _publish_later(self):
+        delay = self.last_published + self.min_interval - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await self.publish()
+
+    def _stats(self):
+        statistics = self.statistics_source()
+        return statistics.to_statistics() if statistics else None
+
+    def snapshot(self):
+        """Build a snapshot from the statistics cache, consuming the pending changes."""
+        self.seq += 1
+        snapshot = {
+            "seq": self.seq,
+            "timestamp": datetime.now().isoformat(),
+            "stats": self._stats(),
+            "changes": list(self.changes),
+            "truncated": self.dropped_changes > 0,
+        }
+        self.changes.clear()
+        self.dropped_changes = 0
+        return snapshot
+
+    async def publish(self):
+        """Emit a snapshot to every subscriber channel now."""
+        snapshot = self.snapshot()
+        self.last_published = time.monotonic()
+        for emitter in self.emitters:
+            try:
+                await emitter("dashboard_snapshot", snapshot)
+            except Exception as e:
+                log.error("Failed to publish dashboard snapshot: %s", e)
+        return snapshot
+
+    def latest(self):
+        """Current statistics with no change list, as the initial state for new subscribers."""
+        return {
+            "seq": self.seq,
+            "timestamp": datetime.now().isoformat(),
+            "stats": self._stats(),
+            "changes": [],
+            "truncated": False,
+        }
+
+    async def close(self):
+        if self._scheduled is not None:
+            self._scheduled.cancel()
+            await asyncio.gather(self._scheduled, return_exceptions=True)
+            self._scheduled = None
@@ -0,0 +1,71 @@
+#models/generations.py
+
+import os
+import itertools
+from fastapi import HTTPException, Request
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from backend.models.static_assets import etag_matches
+
+
+class WriteGenerations:
+    """
+    Per-table write counters for conditional GETs.
+    A session that writes to a table (ORM flush or insert/update/delete statement) bumps
+    that table's generation when it commits, so a list response tagged with the generations
+    it was read at stays valid until the next committed write. Counters live in this process:
+    they assume, like the notification and activity stores, that one process owns the writes.
+    """
+
+    def __init__(self):
+        self.epoch = os.urandom(4).hex()  # Counters restart at zero, so tags from a previous run never match
+        self.values = {}
+
+    def bump(self, *tables):
+        for table in tables:
+            self.values[table] = self.values.get(table, 0) + 1
+
+    def etag(self, *tables):
+        return '"' + ".".join([self.epoch] + [str(self.values.get(table, 0)) for table in tables]) + '"'
+
+    def guard(self, *tables):
+        """
+        FastAPI dependency for a list endpoint reading `tables`. Answers 304 when If-None-Match
+        already holds the current tag; otherwise returns the validator headers for the response.
+        It runs before the endpoint body, so the tag is taken before the rows are read.
+        """
+        def dependency(request: Request):
+            headers = {"ETag": self.etag(*tables), "Cache-Control": "no-cache"}
+            if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+                raise HTTPException(status_code=304, headers=headers)
+            return headers
+        return dependency
+
+    def track(self, session_class=Session):
+        """Collect the tables each session writes to and bump them once its transaction commits."""
+
+        def written(session):
+            return session.info.setdefault("written_tables", set())
+
+        @event.listens_for(session_class, "after_flush")
+        def after_flush(session, flush_context):
+            for instance in itertools.chain(session.new, session.dirty, session.deleted):
+                written(session).add(instance.__tablename__)
+
+        @event.listens_for(session_class, "do_orm_execute")
+        def do_orm_execute(state):
+            if state.is_insert or state.is_update or state.is_delete:
+                written(state.session).add(state.statement.table.name)
+
+        @event.listens_for(session_class, "after_commit")
+        def after_commit(session):
+            tables = session.info.pop("written_tables", None)
+            if tables:
+                self.bump(*tables)
+
+        @event.listens_for(session_class, "after_rollback")
+        def after_rollback(session):
+            session.info.pop("written_tables", None)
+
+
+generations = WriteGenerations()
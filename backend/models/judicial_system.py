@@ -1,21 +1,213 @@
 #judicial_system.py
 
-import logging
+import os
+import time
+import random
+import asyncio
+from collections import deque
 from datetime import datetime
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from backend.models.case import Case
+from backend.models.case import Case, DecisionEnum
+from backend.models.norm import Norm
+from backend.models.logs import get_logger
+
+log = get_logger("judicial")
+
+# Upper bound on the cases resolved by one batch call
+MAX_SOLVE_BATCH = 10000
+
+# Auto-adjudication defaults, overridable per deployment
+ADJUDICATION_WORKERS = int(os.getenv("ADJUDICATION_WORKERS", 4))
+ADJUDICATION_BATCH_SIZE = int(os.getenv("ADJUDICATION_BATCH_SIZE", 50))
+ADJUDICATION_SERVICE_TIME = float(os.getenv("ADJUDICATION_SERVICE_TIME", 0.01))  # Seconds per complexity point
+
+
+class AdjudicationPool:
+    """
+    Asyncio worker pool that resolves pending cases without human input, modelling
+    judicial processing capacity.
+    A feeder pages through pending cases (keyset on id) into a bounded queue; each worker
+    takes up to `batch_size` of them, spends `service_time` seconds per complexity point
+    of their norms, then resolves the batch with one UPDATE per decision.
+    """
+
+    def __init__(self, judicial_system, workers=ADJUDICATION_WORKERS, batch_size=ADJUDICATION_BATCH_SIZE,
+                 service_time=ADJUDICATION_SERVICE_TIME, accept_rate=0.5, poll_interval=1.0, window=60.0):
+        self.judicial_system = judicial_system
+        self.size = workers
+        self.batch_size = batch_size
+        self.service_time = service_time
+        self.accept_rate = accept_rate
+        self.poll_interval = poll_interval
+        self.window = window              # Seconds covered by the recent throughput figure
+        self.session_factory = None
+        self.on_solved = None             # Callable (solved, resolved_at, decision) run after each UPDATE
+        self.queue = None
+        self.feeder = None
+        self.workers = {}                 # Worker index -> task
+        self.serving = set()              # Indexes of the workers with a batch in service
+        self.cursor = 0                   # Highest case id handed to the queue
+        self.busy = 0
+        self.solved = 0
+        self.batches = 0
+        self.errors = 0
+        self.started_at = None
+        self.recent = deque()             # (monotonic time, cases solved) per batch
+
+    @property
+    def running(self):
+        return self.feeder is not None
+
+    def start(self, session_factory, on_solved=None, workers=None, batch_size=None, service_time=None):
+        """Start the feeder and workers; settings given here replace the current ones."""
+        if self.running:
+            raise RuntimeError("Adjudication is already running")
+        self.session_factory = session_factory
+        self.on_solved = on_solved
+        self.batch_size = batch_size or self.batch_size
+        self.service_time = self.service_time if service_time is None else service_time
+        self.queue = asyncio.Queue(maxsize=self.batch_size * max(1, workers or self.size) * 2)
+        self.cursor = 0  # Re-read from the start: a previous stop may have dropped queued cases
+        self.started_at = time.monotonic()
+        self.feeder = asyncio.create_task(self._feed())
+        self.resize(workers or self.size)
+        log.info("⚖️ Auto-adjudication started with %s workers", self.size)
+
+    def resize(self, workers):
+        """Change the worker count; idle surplus workers stop now, busy ones after their current batch."""
+        if workers < 0:
+            raise ValueError("workers must be >= 0")
+        self.size = workers
+        if not self.running:
+            return
+        for index in [index for index in self.workers if index >= workers and index not in self.serving]:
+            self.workers.pop(index).cancel()  # Waiting on the queue: nothing taken, nothing lost
+        for index in range(workers):
+            task = self.workers.get(index)
+            if task is None or task.done():
+                self.workers[index] = asyncio.create_task(self._work(index))
+
+    async def stop(self):
+        """Cancel the feeder and workers; batches in service stay pending in the database."""
+        tasks = list(self.workers.values()) + ([self.feeder] if self.feeder else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.workers.clear()
+        self.serving.clear()
+        self.feeder = None
+        self.queue = None
+        self.busy = 0
+        log.info("⚖️ Auto-adjudication stopped")
+
+    async def _feed(self):
+        while True:
+            room = self.queue.maxsize - self.queue.qsize()
+            if room < self.batch_size:
+                await asyncio.sleep(self.poll_interval / 10)
+                continue
+            try:
+                async with self.session_factory() as session:
+                    result = await session.execute(
+                        select(Case.id, Case.created_at, Norm.complexity)
+                        .join(Norm, Case.norm_id == Norm.id)
+                        .where(Case.status == "pending", Case.id > self.cursor)
+                        .order_by(Case.id)
+                        .limit(room)
+                    )
+                    rows = result.all()
+            except Exception as e:
+                log.error("❌ Adjudication feeder failed: %s", e)
+                rows = []
+            if not rows:
+                await asyncio.sleep(self.poll_interval)
+                continue
+            self.cursor = rows[-1].id
+            for row in rows:
+                await self.queue.put(row)
+
+    async def _work(self, index):
+        while index < self.size:
+            batch = [await self.queue.get()]
+            while len(batch) < self.batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            if index >= self.size:
+                # Resized away while waiting: hand the rows back for the remaining workers
+                for row in batch:
+                    self.queue.put_nowait(row)
+                return
+
+            self.busy += 1
+            self.serving.add(index)
+            try:
+                await asyncio.sleep(self.service_time * sum(row.complexity or 1 for row in batch))
+                accepted, rejected = [], []
+                for row in batch:
+                    (accepted if random.random() < self.accept_rate else rejected).append(row.id)
+                for decision, case_ids in ((DecisionEnum.ACCEPTED, accepted), (DecisionEnum.REJECTED, rejected)):
+                    if case_ids:
+                        await self._resolve(decision, case_ids)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                log.error("❌ Adjudication worker %s failed: %s", index, e)
+            finally:
+                self.busy -= 1
+                self.serving.discard(index)
+
+    async def _resolve(self, decision, case_ids):
+        async with self.session_factory() as session:
+            solved, resolved_at, _ = await self.judicial_system.solve_cases(
+                session, decision.value, case_ids=case_ids
+            )
+        self.batches += 1
+        self.solved += len(solved)
+        self.recent.append((time.monotonic(), len(solved)))
+        if solved and self.on_solved:
+            self.on_solved(solved, resolved_at, decision.value)
+
+    def throughput(self):
+        """Cases solved per second over the recent window."""
+        now = time.monotonic()
+        while self.recent and self.recent[0][0] < now - self.window:
+            self.recent.popleft()
+        if not self.recent or not self.started_at:
+            return 0.0
+        span = min(self.window, now - self.started_at)
+        return round(sum(count for _, count in self.recent) / max(span, 1e-6), 3)
+
+    def stats(self):
+        elapsed = time.monotonic() - self.started_at if self.started_at else 0.0
+        return {
+            "running": self.running,
+            "workers": self.size,
+            "busy_workers": self.busy,
+            "batch_size": self.batch_size,
+            "service_time_per_complexity": self.service_time,
+            "queue_depth": self.queue.qsize() if self.queue else 0,
+            "cases_solved": self.solved,
+            "batches": self.batches,
+            "errors": self.errors,
+            "throughput_per_second": self.throughput(),
+            "average_throughput_per_second": round(self.solved / elapsed, 3) if elapsed else 0.0,
+        }
 
-logging.basicConfig(level=logging.DEBUG, format="%(message)s")
 
 class JudicialSystem:
     def __init__(self):
         self.case_counter = 0  # Removed local lists (DB will handle it)
+        self.adjudication = AdjudicationPool(self)  # Idle until started
 
     async def check_constitutionality(self, norm):
-        """Log norm constitutionality check (async-compatible)."""
-        log_message = f"Checking constitutionality of norm {norm.id} with complexity {norm.complexity}"
-        logging.info(log_message)
+        """Log norm constitutionality check (async-compatible). Accepts a Norm or its dict form."""
+        if isinstance(norm, dict):
+            norm_id, complexity = norm["id"], norm["complexity"]
+        else:
+            norm_id, complexity = norm.id, norm.complexity
+        log.debug("Checking constitutionality of norm %s with complexity %s", norm_id, complexity)
 
     async def create_case(self, session: AsyncSession, norm):
         """Create a new case and store it in the database."""
@@ -29,7 +221,7 @@ class JudicialSystem:
             await session.commit()
             await session.refresh(case)
 
-            logging.info(f"✅ Created Case #{case.id} linked to Norm #{norm.id}")
+            log.debug("✅ Created Case #%s linked to Norm #%s", case.id, norm.id)
             return case.to_dict()
         return None
 
@@ -45,7 +237,7 @@ class JudicialSystem:
             await session.commit()
             await session.refresh(case)
 
-            logging.info(f"✅ Created Pressure Case #{case.id} for Norm #{norm.id}")
+            log.debug("✅ Created Pressure Case #%s for Norm #%s", case.id, norm.id)
             return case.to_dict()
         return None
 
@@ -59,6 +251,53 @@ class JudicialSystem:
             case.status = "solved"
             await session.commit()
 
-            logging.info(f"✅ Case {case.id} resolved at {case.resolved_at}")
+            log.info("✅ Case %s resolved at %s", case.id, case.resolved_at)
             return case.to_dict()
         return None
+
+    async def solve_cases(self, session: AsyncSession, decision, case_ids=None, norm_id=None, limit=MAX_SOLVE_BATCH,
+                          resolved_at=None):
+        """
+        Resolve many pending cases with one set-based UPDATE ... RETURNING.
+        Targets the given `case_ids`, or else the pending cases (optionally of `norm_id`),
+        oldest first and at most `limit` of them. `resolved_at` defaults to now.
+        Returns (solved, resolved_at, outcomes): `solved` holds (id, created_at) of the
+        resolved cases, `outcomes` maps every requested id to "solved", "already_solved",
+        "not_found" or "skipped" (past `limit`, left untouched).
+        """
+        limit = max(1, min(limit, MAX_SOLVE_BATCH))
+        if case_ids is not None:
+            requested = list(dict.fromkeys(case_ids))
+            targets, skipped = requested[:limit], requested[limit:]
+            condition = Case.id.in_(targets)
+        else:
+            pending = select(Case.id).where(Case.status == "pending")
+            if norm_id is not None:
+                pending = pending.where(Case.norm_id == norm_id)
+            condition = Case.id.in_(pending.order_by(Case.id).limit(limit).scalar_subquery())
+
+        resolved_at = resolved_at or datetime.utcnow()
+        result = await session.execute(
+            update(Case)
+            .where(condition, Case.status != "solved")
+            .values(status="solved", resolved_at=resolved_at, decision=DecisionEnum(decision))
+            .returning(Case.id, Case.created_at)
+            .execution_options(synchronize_session=False)
+        )
+        solved = [tuple(row) for row in result.all()]
+        await session.commit()
+
+        outcomes = {case_id: "solved" for case_id, _ in sorted(solved)}
+        if case_ids is not None:
+            leftover = [case_id for case_id in targets if case_id not in outcomes]
+            if leftover:
+                # Only ids the UPDATE skipped need a lookup to tell the two failure cases apart
+                existing = await session.execute(select(Case.id).where(Case.id.in_(leftover)))
+                found = set(existing.scalars().all())
+                for case_id in leftover:
+                    outcomes[case_id] = "already_solved" if case_id in found else "not_found"
+            outcomes = {case_id: outcomes[case_id] for case_id in targets}
+            outcomes.update((case_id, "skipped") for case_id in skipped)
+
+        log.info("✅ Resolved %s cases as %s at %s", len(solved), decision, resolved_at)
+        return solved, resolved_at, outcomes
@@ -0,0 +1,186 @@
+#models/logs.py
+
+"""
+Logging pipeline for the app.
+
+Records are handed to a queue on the calling thread and formatted and written by a
+QueueListener thread, so the event loop only pays for the level check, the sampling
+filter and a queue put. Loggers are named per subsystem (`optimus.api`,
+`optimus.judicial`, ...), so their levels can be set independently:
+
+    LOG_LEVEL=INFO LOG_LEVELS=optimus.api=WARNING,sqlalchemy.engine=INFO LOG_FORMAT=json
+
+Per-request messages are sampled: each message template of a sampled subsystem is let
+through at most `LOG_SAMPLE_RATE` times per second (after a burst of `LOG_SAMPLE_BURST`),
+and the next record that passes reports how many were dropped.
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import atexit
+import logging
+import logging.handlers
+
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text")  # text or json
+LOG_FILE = os.getenv("LOG_FILE")  # Also write to this file when set
+LOG_SAMPLED = tuple(name for name in os.getenv("LOG_SAMPLED", "optimus.api,optimus.websocket").split(",") if name)
+LOG_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", 1.0))
+LOG_SAMPLE_BURST = int(os.getenv("LOG_SAMPLE_BURST", 10))
+
+_listener = None
+
+
+def get_logger(subsystem):
+    """Logger for one subsystem, e.g. get_logger("judicial") -> `optimus.judicial`."""
+    return logging.getLogger(f"optimus.{subsystem}")
+
+
+class Event:
+    """
+    Structured log message, rendered only if a handler actually emits it:
+
+        log.info(Event("cases_solved", count=len(solved), decision=decision))
+
+    Field values should be immutable (numbers, strings), since rendering happens later
+    on the listener thread.
+    """
+
+    __slots__ = ("name", "fields")
+
+    def __init__(self, name, **fields):
+        self.name = name
+        self.fields = fields
+
+    def __str__(self):
+        return " ".join([self.name] + [f"{key}={value}" for key, value in self.fields.items()])
+
+
+class SamplingFilter(logging.Filter):
+    """Token bucket per (logger, message template) for the sampled subsystems; warnings always pass."""
+
+    def __init__(self, prefixes=LOG_SAMPLED, rate=LOG_SAMPLE_RATE, burst=LOG_SAMPLE_BURST):
+        super().__init__()
+        self.prefixes = prefixes
+        self.rate = rate
+        self.burst = burst
+        self.buckets = {}  # key -> [tokens, last refill, suppressed]
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING or not record.name.startswith(self.prefixes):
+            return True
+        key = (record.name, record.msg if isinstance(record.msg, str) else getattr(record.msg, "name", None))
+        now = time.monotonic()
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = [float(self.burst), now, 0]
+        bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+        bucket[1] = now
+        if bucket[0] < 1:
+            bucket[2] += 1
+            return False
+        bucket[0] -= 1
+        if bucket[2]:
+            record.suppressed = bucket[2]
+            bucket[2] = 0
+        return True
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread.
+    The stock handler renders the message before enqueueing; the queue is in-process here,
+    so the record can travel as-is.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+class TextFormatter(logging.Formatter):
+    def format(self, record):
+        line = super().format(record)
+        suppressed = getattr(record, "suppressed", 0)
+        return f"{line} (+{suppressed} similar suppressed)" if suppressed else line
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per line; Event fields become top-level keys."""
+
+    def format(self, record):
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+        }
+        if isinstance(record.msg, Event) and not record.args:
+            entry["event"] = record.msg.name
+            entry.update(record.msg.fields)
+        else:
+            entry["message"] = record.getMessage()
+        if getattr(record, "suppressed", 0):
+            entry["suppressed"] = record.suppressed
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def parse_levels(value):
+    """`name=LEVEL,name=LEVEL` into {name: LEVEL}."""
+    levels = {}
+    for item in (value or "").split(","):
+        name, _, level = item.partition("=")
+        if name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def configure_logging(level=None, levels=None):
+    """
+    Route every record through a queue to a listener thread that formats and writes it.
+    `level` is the root level (LOG_LEVEL, INFO by default) and `levels` the per-subsystem
+    overrides (LOG_LEVELS). Safe to call again: the previous pipeline is replaced.
+    """
+    global _listener
+    stop_logging()
+
+    formatter = JSONFormatter() if LOG_FORMAT == "json" else TextFormatter("%(message)s")
+    handlers = [logging.StreamHandler(sys.stderr)]
+    if LOG_FILE:
+        handlers.append(logging.FileHandler(LOG_FILE))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    records = queue.SimpleQueue()
+    queue_handler = DeferredQueueHandler(records)
+    queue_handler.addFilter(SamplingFilter())
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel((level or os.getenv("LOG_LEVEL", "INFO")).upper())
+
+    overrides = {"sqlalchemy": "WARNING"}  # SQL echo and pool chatter only when asked for
+    overrides.update(parse_levels(os.getenv("LOG_LEVELS")))
+    overrides.update(levels or {})
+    for name, subsystem_level in overrides.items():
+        logging.getLogger(name).setLevel(subsystem_level)
+
+    _listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)  # Drain the queue on interpreter exit
+    return _listener
+
+
+def stop_logging():
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    atexit.unregister(stop_logging)
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
@@ -0,0 +1,223 @@
+#models/metrics.py
+
+import time
+import bisect
+import contextvars
+from sqlalchemy import event
+
+# Latency buckets in seconds, and buckets for SQL statements per request
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100, 250)
+
+# SQL accounting for the request being served; None outside of a request
+current_request = contextvars.ContextVar("current_request", default=None)
+
+
+class RequestStats:
+    """SQL statements and database time spent by one request."""
+
+    __slots__ = ("queries", "db_seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra=None):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class CounterMetric:
+    """Monotonic counter, one value per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.label_names = labels
+        self.values = {}
+
+    def inc(self, *labels, amount=1):
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def samples(self):
+        for labels, value in sorted(self.values.items()):
+            yield f"{self.name}{_labels(self.label_names, labels)} {value}"
+
+
+class HistogramMetric:
+    """Cumulative-bucket histogram, one set of buckets per label set."""
+
+    kind = "histogram"
+
+    def __init__(self, name, help, labels=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.label_names = labels
+        self.buckets = tuple(buckets)
+        self.series = {}  # labels -> [bucket counts..., +Inf count, sum]
+
+    def observe(self, value, *labels):
+        series = self.series.get(labels)
+        if series is None:
+            series = self.series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect.bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def samples(self):
+        for labels, series in sorted(self.series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), series[:-1]):
+                cumulative += count
+                le = f'le="{bound}"'
+                yield f"{self.name}_bucket{_labels(self.label_names, labels, le)} {cumulative}"
+            yield f"{self.name}_sum{_labels(self.label_names, labels)} {series[-1]}"
+            yield f"{self.name}_count{_labels(self.label_names, labels)} {cumulative}"
+
+
+class GaugeMetric:
+    """Value read from a callable at scrape time (a gauge, or a counter kept elsewhere)."""
+
+    def __init__(self, name, help, read, kind="gauge"):
+        self.name = name
+        self.help = help
+        self.read = read
+        self.kind = kind
+
+    def samples(self):
+        yield f"{self.name} {self.read()}"
+
+
+class MetricsRegistry:
+    """
+    In-process metrics rendered in the Prometheus text exposition format.
+    Updates are plain dictionary operations on the event loop thread, so recording
+    a request costs a few microseconds and needs no locking.
+    """
+
+    def __init__(self, prefix="optimus"):
+        self.prefix = prefix
+        self.metrics = []
+        self.instrumented = set()  # Engines already hooked, so a rebuilt lifespan doesn't count twice
+
+        self.requests = self.counter("http_requests_total", "HTTP requests served.", ("method", "route", "status"))
+        self.latency = self.histogram(
+            "http_request_duration_seconds", "HTTP request latency.", ("method", "route")
+        )
+        self.request_queries = self.histogram(
+            "http_request_db_queries", "SQL statements executed per HTTP request.", ("method", "route"),
+            buckets=QUERY_COUNT_BUCKETS,
+        )
+        self.request_db_time = self.histogram(
+            "http_request_db_seconds", "Database time spent per HTTP request.", ("method", "route")
+        )
+        self.queries = self.counter("db_queries_total", "SQL statements executed, including background work.")
+        self.db_time = self.counter("db_query_seconds_total", "Time spent executing SQL statements.")
+
+    def counter(self, name, help, labels=()):
+        return self._add(CounterMetric(f"{self.prefix}_{name}", help, labels))
+
+    def histogram(self, name, help, labels=(), buckets=LATENCY_BUCKETS):
+        return self._add(HistogramMetric(f"{self.prefix}_{name}", help, labels, buckets))
+
+    def gauge(self, name, help, read, kind="gauge"):
+        return self._add(GaugeMetric(f"{self.prefix}_{name}", help, read, kind))
+
+    def _add(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def observe_request(self, method, route, status, seconds, stats):
+        self.requests.inc(method, route, str(status))
+        self.latency.observe(seconds, method, route)
+        self.request_queries.observe(stats.queries, method, route)
+        self.request_db_time.observe(stats.db_seconds, method, route)
+
+    def observe_query(self, seconds):
+        self.queries.inc()
+        self.db_time.inc(amount=seconds)
+        stats = current_request.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.db_seconds += seconds
+
+    def render(self):
+        lines = []
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+    def instrument_engine(self, engine):
+        """Time every SQL statement of `engine` through cursor execute events."""
+        sync_engine = getattr(engine, "sync_engine", engine)
+        if id(sync_engine) in self.instrumented:
+            return engine
+        self.instrumented.add(id(sync_engine))
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            started = conn.info["query_started"].pop()
+            self.observe_query(time.perf_counter() - started)
+
+        @event.listens_for(sync_engine, "handle_error")
+        def handle_error(context):
+            # A failed statement never reaches after_cursor_execute
+            started = context.connection.info.get("query_started") if context.connection else None
+            if started:
+                started.pop()
+
+        return engine
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording latency, status and SQL usage per HTTP request.
+    Requests are labelled with the matched route template (e.g. /api/solve_case/{case_id})
+    rather than the raw path, so label cardinality stays bounded.
+    """
+
+    def __init__(self, app, registry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        stats = RequestStats()
+        token = current_request.set(stats)
+        status = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_request.reset(token)
+            # Mounted apps (static assets, Socket.IO) have no route; label them by mount path
+            route = getattr(scope.get("route"), "path", None) or scope.get("root_path") or "unmatched"
+            self.registry.observe_request(
+                scope["method"], route, status, time.perf_counter() - started, stats
+            )
+
+
+metrics = MetricsRegistry()
@@ -1,13 +1,14 @@
-import logging
 import datetime
-from sqlalchemy import Column, Integer, String, Boolean, select, func
+from sqlalchemy import Column, Integer, String, Boolean, Index, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import relationship
 from sqlalchemy.types import DateTime  # Import DateTime from SQLAlchemy
 from backend.models import Base
 from .notification_manager import NotificationManager
+from backend.models.logs import get_logger
+
+log = get_logger("political")
 
-logging.basicConfig(level=logging.DEBUG, format="%(message)s")
 
 class Norm(Base):
     __tablename__ = "norms"
@@ -19,8 +20,14 @@ class Norm(Base):
     constitutional = Column(Boolean, default=False)
     created_at = Column(DateTime, default=func.now())  # Use DateTime from SQLAlchemy
 
-    # Define relationship before Case references it
-    cases = relationship("Case", back_populates="norm", lazy="selectin")
+    # Define relationship before Case references it; never loaded implicitly (see models/queries.py)
+    cases = relationship("Case", back_populates="norm", lazy="raise_on_sql")
+
+    # Valid-norm lookups and listings ordered by creation date
+    __table_args__ = (
+        Index("ix_norms_valid_id", "valid", "id"),
+        Index("ix_norms_created_at", "created_at"),
+    )
 
     def to_dict(self):
         return {
@@ -49,9 +56,9 @@ class Norm(Base):
                 "valid": self.valid
             })
         except RuntimeError:
-            logging.warning("Async operation ignored (not in an async context).")
+            log.warning("Async operation ignored (not in an async context).")
 
-        logging.info(f"Norm {self.id}: Invalidated")
+        log.info("Norm %s: Invalidated", self.id)
 
 # Legacy Norm class for in-memory usage (optional, if needed)
 class LegacyNorm:
@@ -77,6 +84,4 @@ class LegacyNorm:
 
     def log_event(self, message):
         """Log an event for this norm."""
-        log_message = f"LegacyNorm {self.id}: {message}"
-        logging.info(log_message)
-        print(log_message)
+        log.info("LegacyNorm %s: %s", self.id, message)
@@ -1,85 +1,368 @@
 #notification_manager.py
 
 import os
-import logging
 import asyncio
 import json
+import time
+from collections import deque
+from datetime import datetime
 from fastapi.websockets import WebSocket
+from backend.models.logs import get_logger
 
-logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+log = get_logger("notifications")
 
-class NotificationManager:
-    def __init__(self):
-        self.notifications = []
-        self.websocket_clients = set()  # Store multiple WebSocket connections
-        self.notifications_file = "data/notifications.json"
 
-        # Ensure data directory exists
-        os.makedirs("data", exist_ok=True)
+class NotificationStore:
+    """
+    Notification history kept in an in-memory ring buffer.
+    New entries are appended to a JSON-lines file by a background task, in batches of
+    `flush_size` or every `flush_interval` seconds, so adding one never touches the disk.
+    Each notification carries an increasing `id` usable as a `since` offset.
+    """
+
+    def __init__(self, path="data/notifications.jsonl", legacy_path="data/notifications.json",
+                 capacity=1000, flush_size=50, flush_interval=2.0):
+        self.path = path
+        self.legacy_path = legacy_path
+        self.capacity = capacity
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.buffer = deque(maxlen=capacity)
+        self.pending = []       # Added but not yet persisted
+        self.max_pending = capacity  # Older unsaved entries are dropped while the disk keeps failing
+        self.next_id = 1
+        self.loaded = False
+        self.persisted_lines = 0
+        self._flush_task = None
+        self._flush_requested = None
+
+    def load(self):
+        """Load the most recent notifications from disk (blocking; run it off the event loop)."""
+        if self.loaded:
+            return
+        entries = []
+        try:
+            with open(self.path, "r") as f:
+                for line in f:
+                    self.persisted_lines += 1
+                    try:
+                        entries.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue
+        except FileNotFoundError:
+            # Import the history of the former whole-file JSON store once
+            try:
+                with open(self.legacy_path, "r") as f:
+                    entries = json.load(f)
+                self.pending.extend(entries[-self.capacity:])
+            except (FileNotFoundError, json.JSONDecodeError):
+                entries = []
+
+        for entry in entries[-self.capacity:]:
+            if "id" not in entry:
+                entry["id"] = self.next_id
+            self.next_id = max(self.next_id, entry["id"] + 1)
+            self.buffer.append(entry)
+        self.loaded = True
+
+    def add(self, message, type="info"):
+        """Record a notification in memory and queue it for the next flush."""
+        if not self.loaded:
+            self.load()
+        notification = {
+            "id": self.next_id,
+            "message": message,
+            "timestamp": datetime.now().isoformat(),
+            "type": type
+        }
+        self.next_id += 1
+        self.buffer.append(notification)
+        self.pending.append(notification)
+        if len(self.pending) >= self.flush_size and self._flush_requested is not None:
+            self._flush_requested.set()
+        return notification
+
+    def since(self, offset=None, limit=None):
+        """Return buffered notifications with an id greater than `offset`, oldest first."""
+        if not self.loaded:
+            self.load()
+        if offset is None:
+            notifications = list(self.buffer)
+        else:
+            notifications = [n for n in self.buffer if n["id"] > offset]
+        return notifications[-limit:] if limit else notifications
+
+    def _append(self, batch, snapshot=None):
+        """
+        Append a batch to the JSON-lines file, or rewrite the file from `snapshot` when it has
+        grown too long. Both are taken on the event loop: this runs in a worker thread.
+        """
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        if snapshot is None:
+            with open(self.path, "a") as f:
+                f.write("".join(json.dumps(n) + "\n" for n in batch))
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write("".join(json.dumps(n) + "\n" for n in snapshot))
+        os.replace(tmp_path, self.path)
+
+    async def flush(self):
+        """Persist queued notifications off the event loop."""
+        if not self.pending:
+            return
+        batch, self.pending = self.pending, []
+        snapshot = None
+        if self.persisted_lines + len(batch) > self.capacity * 10:
+            # Compact to the buffered entries up to this batch; later ones are still pending
+            last_id = batch[-1]["id"]
+            snapshot = [n for n in self.buffer if n["id"] <= last_id]
+        try:
+            await asyncio.to_thread(self._append, batch, snapshot)
+        except Exception as e:
+            log.error("Failed to save notifications: %s", e)
+            self.pending = batch + self.pending
+            if len(self.pending) > self.max_pending:
+                log.warning("⚠️ Dropping %s unsaved notifications", len(self.pending) - self.max_pending)
+                del self.pending[:-self.max_pending]
+            return
+        self.persisted_lines = len(snapshot) if snapshot is not None else self.persisted_lines + len(batch)
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            await self.flush()
+
+    async def start(self):
+        """Load history and start the background flush task."""
+        await asyncio.to_thread(self.load)
+        if self._flush_task is None:
+            self._flush_requested = asyncio.Event()
+            self._flush_task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the flush task and persist whatever is still queued."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+            self._flush_requested = None
+        await self.flush()
+
+
+# Shared by every NotificationManager in the process
+notification_store = NotificationStore()
+
+
+class ClientChannel:
+    """Outbound state of one WebSocket client: a bounded queue drained by its own writer task."""
+
+    def __init__(self, websocket, max_queue):
+        self.websocket = websocket
+        self.max_queue = max_queue
+        self.queue = deque()        # (coalescing key, payload, enqueued_at)
+        self.pending_keys = set()   # Keys of queued payloads, for duplicate coalescing
+        self.ready = asyncio.Event()
+        self.overflow_since = None  # When the queue first hit its limit
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.last_lag = 0.0
+        self.task = None
+
+    def stats(self):
+        oldest = self.queue[0][2] if self.queue else None
+        now = time.monotonic()
+        return {
+            "client": f"{getattr(self.websocket, 'client', None)}",
+            "queued": len(self.queue),
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "last_lag_seconds": round(self.last_lag, 4),
+            "oldest_queued_seconds": round(now - oldest, 4) if oldest else 0.0,
+        }
+
+
+class WebSocketBroadcaster:
+    """
+    Fan-out of JSON events to WebSocket clients.
+    `publish` only enqueues, so its cost does not depend on the number of clients. A
+    dispatcher task copies each event into every client's bounded queue (skipping
+    duplicates still waiting there), and one writer task per client sends them.
+    Clients that stay at their queue limit for `evict_after` seconds are disconnected.
+    """
+
+    def __init__(self, max_queue=100, evict_after=5.0, send_timeout=5.0):
+        self.max_queue = max_queue
+        self.evict_after = evict_after
+        self.send_timeout = send_timeout
+        self.channels = {}
+        self.inbox = None
+        self._dispatcher = None
+        self.evicted = 0
+
+    def __len__(self):
+        return len(self.channels)
+
+    def _ensure_dispatcher(self):
+        if self._dispatcher is None:
+            self.inbox = asyncio.Queue()
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+    def register(self, websocket):
+        """Start delivering broadcasts to an accepted WebSocket."""
+        self._ensure_dispatcher()
+        channel = ClientChannel(websocket, self.max_queue)
+        channel.task = asyncio.create_task(self._write(channel))
+        self.channels[websocket] = channel
+        return channel
 
-        # Load notifications from file (if available)
-        self.load_notifications()
+    async def unregister(self, websocket):
+        """Stop delivering to a WebSocket and wait for its writer to finish."""
+        channel = self.channels.pop(websocket, None)
+        if channel and channel.task and channel.task is not asyncio.current_task():
+            channel.task.cancel()
+            await asyncio.gather(channel.task, return_exceptions=True)
+
+    def send_to(self, websocket, data):
+        """Queue an event for a single client, e.g. the initial state of a new subscriber."""
+        channel = self.channels.get(websocket)
+        if channel is not None:
+            self._enqueue(channel, json.dumps(data, sort_keys=True, default=str), data, time.monotonic())
+
+    def publish(self, data, key=None):
+        """Queue an event for every client without waiting on any of them."""
+        self._ensure_dispatcher()
+        if key is None:
+            key = json.dumps(data, sort_keys=True, default=str)
+        self.inbox.put_nowait((key, data))
+
+    async def _dispatch(self):
+        while True:
+            key, data = await self.inbox.get()
+            now = time.monotonic()
+            for channel in list(self.channels.values()):
+                self._enqueue(channel, key, data, now)
+
+    def _enqueue(self, channel, key, data, now):
+        if key in channel.pending_keys:
+            channel.coalesced += 1
+            return
+
+        if len(channel.queue) >= channel.max_queue:
+            if channel.overflow_since is None:
+                channel.overflow_since = now
+            elif now - channel.overflow_since >= self.evict_after:
+                self._evict(channel)
+                return
+            # Keep the queue bounded: the oldest event gives way to the newest
+            old_key, _, _ = channel.queue.popleft()
+            channel.pending_keys.discard(old_key)
+            channel.dropped += 1
+
+        channel.queue.append((key, data, now))
+        channel.pending_keys.add(key)
+        channel.ready.set()
+
+    def _evict(self, channel):
+        """Disconnect a client that cannot keep up."""
+        log.warning("⚠️ Evicting slow WebSocket client %s (%s queued)", channel.websocket.client, len(channel.queue))
+        self.channels.pop(channel.websocket, None)
+        self.evicted += 1
+        if channel.task:
+            channel.task.cancel()
+        asyncio.create_task(self._close(channel.websocket))
+
+    async def _close(self, websocket):
+        try:
+            await websocket.close(code=1008, reason="Slow consumer")
+        except Exception as e:
+            log.warning("⚠️ Attempted to close an already closed WebSocket: %s", e)
+
+    async def _write(self, channel):
+        while True:
+            await channel.ready.wait()
+            while channel.queue:
+                key, data, enqueued_at = channel.queue.popleft()
+                channel.pending_keys.discard(key)
+                if len(channel.queue) < channel.max_queue:
+                    channel.overflow_since = None
+                try:
+                    await asyncio.wait_for(channel.websocket.send_json(data), timeout=self.send_timeout)
+                except Exception as e:
+                    log.error("❌ Failed to send WebSocket message: %s", e)
+                    self._evict(channel)
+                    return
+                channel.sent += 1
+                channel.last_lag = time.monotonic() - enqueued_at
+            channel.ready.clear()
+
+    def stats(self):
+        """Per-client queue depth and lag."""
+        return {
+            "clients": len(self.channels),
+            "evicted": self.evicted,
+            "pending_dispatch": self.inbox.qsize() if self.inbox else 0,
+            "channels": [channel.stats() for channel in self.channels.values()],
+        }
+
+    async def close(self):
+        """Stop the dispatcher and every writer task."""
+        for websocket in list(self.channels):
+            await self.unregister(websocket)
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            await asyncio.gather(self._dispatcher, return_exceptions=True)
+            self._dispatcher = None
+
+
+# Shared by every NotificationManager in the process
+broadcaster = WebSocketBroadcaster()
+
+
+class NotificationManager:
+    def __init__(self, store=None, fanout=None):
+        self.store = store or notification_store  # History lives in the shared store
+        self.fanout = fanout or broadcaster  # Per-client queues and writer tasks
 
     async def connect_websocket(self, websocket: WebSocket):
         """ Handle WebSocket connection. """
         await websocket.accept()
-        self.websocket_clients.add(websocket)
-        logging.info("New WebSocket client connected.")
+        self.fanout.register(websocket)
+        log.info("New WebSocket client connected.")
 
         try:
             while True:
                 data = await websocket.receive_text()
-                logging.info(f"WebSocket received: {data}")
+                log.info("WebSocket received: %s", data)
         except Exception as e:
-            logging.error(f"WebSocket error: {e}")
+            log.error("WebSocket error: %s", e)
         finally:
-            self.websocket_clients.remove(websocket)
-            logging.info("WebSocket client disconnected.")
+            await self.fanout.unregister(websocket)
+            log.info("WebSocket client disconnected.")
 
     async def broadcast_update(self, data):
-        """ Broadcast updates to all connected WebSockets. """
-        if self.websocket_clients:
-            for client in list(self.websocket_clients):
-                try:
-                    await client.send_json(data)
-                except Exception as e:
-                    logging.error(f"Failed to broadcast update: {e}")
-                    self.websocket_clients.remove(client)  # Remove disconnected client
+        """ Broadcast updates to all connected WebSockets without waiting on slow ones. """
+        if len(self.fanout):
+            self.fanout.publish(data)
         else:
-            logging.warning("No active WebSockets to broadcast the update.")
+            log.warning("No active WebSockets to broadcast the update.")
 
     async def add_notification(self, message, type="info"):
-        """ Add a notification and save it to file. """
-        notification = {
-            "message": message,
-            "timestamp": asyncio.get_running_loop().time(),  # ✅ Use get_running_loop() instead of get_event_loop()
-            "type": type
-        }
-        self.notifications.append(notification)
-        self.save_notifications()
+        """ Add a notification; the store persists it in the background. """
+        notification = self.store.add(message, type)
 
         # Broadcast update when notification is added
         await self.broadcast_update({"event": "new_notification", "notification": notification})
 
-    def get_notifications(self):
-        """ Return the list of notifications. """
-        return self.notifications
-
-    def save_notifications(self):
-        """ Save the latest notifications to a file. """
-        try:
-            with open(self.notifications_file, "w") as f:
-                json.dump(self.notifications[-100:], f)
-        except Exception as e:
-            logging.error(f"Failed to save notifications: {e}")
-
-    def load_notifications(self):
-        """ Load notifications from the file if available. """
-        try:
-            with open(self.notifications_file, "r") as f:
-                self.notifications = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            self.notifications = []
+    def get_notifications(self, since=None):
+        """ Return the notifications newer than `since` (all buffered ones by default). """
+        return self.store.since(since)
 
     async def notify_case_solved(self, case):
         """ Notify when a case is solved. """
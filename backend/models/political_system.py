@@ -1,13 +1,40 @@
 #political_system.py
 
-import logging
 import random
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from backend.models.norm import Norm
 from backend.models import Base
+from backend.models.logs import get_logger
 
-logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+log = get_logger("political")
+
+
+# Norm complexity ranges from 1 (simple) to 10 (highly complex)
+MIN_COMPLEXITY, MAX_COMPLEXITY = 1, 10
+
+# Upper bound on the norms created by one batch call
+MAX_NORM_BATCH = 10000
+
+
+def sample_complexities(count, complexity_distribution=None):
+    """
+    Draw `count` norm complexities.
+    `complexity_distribution` is None for uniform 1-10, a {complexity: weight} mapping,
+    or a callable returning one complexity per call.
+    """
+    if complexity_distribution is None:
+        return [random.randint(MIN_COMPLEXITY, MAX_COMPLEXITY) for _ in range(count)]
+    if callable(complexity_distribution):
+        samples = [int(complexity_distribution()) for _ in range(count)]
+    else:
+        values = [int(value) for value in complexity_distribution]
+        weights = list(complexity_distribution.values())
+        if not values or sum(weights) <= 0:
+            raise ValueError("complexity_distribution needs at least one positive weight")
+        samples = random.choices(values, weights=weights, k=count)
+    return [min(MAX_COMPLEXITY, max(MIN_COMPLEXITY, value)) for value in samples]
 
 class PoliticalSystem:
     def __init__(self):
@@ -29,12 +56,43 @@ class PoliticalSystem:
             await session.commit()  # Save changes to the database
             await session.refresh(norm)  # Ensure we get the updated ID
 
-            logging.info(
-                f"✅ Created Norm #{norm.id} - {norm.text} (Valid: {norm.valid}, Complexity: {norm.complexity})"
+            log.info(
+                "✅ Created Norm #%s - %s (Valid: %s, Complexity: %s)", norm.id, norm.text, norm.valid, norm.complexity
             )
             return norm.to_dict()  # Return as a dictionary
 
         except Exception as e:
             await session.rollback()
-            logging.error(f"❌ Error creating norm in the database: {e}")
+            log.error("❌ Error creating norm in the database: %s", e)
             return None
+
+    def build_norm_rows(self, count, complexity_distribution=None):
+        """Build plain insert rows for `count` new valid norms, numbered after the last one."""
+        rows = []
+        for complexity in sample_complexities(count, complexity_distribution):
+            self.norm_counter += 1
+            rows.append({"text": f"Law {self.norm_counter}", "valid": True, "complexity": complexity})
+        return rows
+
+    async def create_norms(self, session: AsyncSession, count, complexity_distribution=None):
+        """
+        Create `count` norms with one multi-row INSERT ... RETURNING in a single transaction.
+        Returns the new norms as (id, text, complexity) rows, in insertion order.
+        """
+        if count < 1 or count > MAX_NORM_BATCH:
+            raise ValueError(f"count must be between 1 and {MAX_NORM_BATCH}")
+        rows = self.build_norm_rows(count, complexity_distribution)
+        try:
+            result = await session.execute(
+                insert(Norm).returning(Norm.id, Norm.text, Norm.complexity, sort_by_parameter_order=True),
+                rows
+            )
+            created = result.all()
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            log.error("❌ Error creating %s norms in the database: %s", count, e)
+            raise
+
+        log.info("✅ Created %s norms (#%s to #%s)", len(created), created[0].id, created[-1].id)
+        return created
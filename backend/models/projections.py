@@ -0,0 +1,111 @@
+#models/projections.py
+
+import numpy as np
+from backend.models.analysis import NormativeInflationModel
+
+HOURS_PER_DAY = 24
+
+
+def backlog_trajectories(norms, solved, initial_backlog=0):
+    """
+    Vectorized B_t = max(0, B_{t-1} + ND_t - PR_t) for many scenarios at once.
+    `norms` and `solved` are (scenarios, days) arrays of daily counts (1-D for one scenario).
+    Uses the closed form of the recurrence, B_t = S_t - min(-B_0, min_{k<=t} S_k) where
+    S is the running sum of ND - PR, so the whole horizon costs two cumulative passes.
+    """
+    net = np.atleast_2d(np.asarray(norms, dtype=float) - np.asarray(solved, dtype=float))
+    running = np.cumsum(net, axis=1)
+    lowest = np.minimum.accumulate(running, axis=1)
+    start = -np.asarray(initial_backlog, dtype=float).reshape(-1, 1)
+    return running - np.minimum(start, lowest)
+
+
+def project(norms, solved, initial_backlog=0, initial_density=0):
+    """
+    Backlog, cumulative density and temporal gap trajectories, each (scenarios, days).
+    The temporal gap is the Little's law estimate of the mean wait of solved work so far:
+    accumulated backlog-days over accumulated resolutions, in hours (NaN before any resolution).
+    """
+    norms = np.atleast_2d(np.asarray(norms, dtype=float))
+    solved = np.atleast_2d(np.asarray(solved, dtype=float))
+    backlog = backlog_trajectories(norms, solved, initial_backlog)
+
+    resolutions = np.cumsum(solved, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gap = np.where(resolutions > 0, np.cumsum(backlog, axis=1) / resolutions * HOURS_PER_DAY, np.nan)
+
+    return {
+        "backlog": backlog,
+        "cumulative_density": np.asarray(initial_density, dtype=float).reshape(-1, 1) + np.cumsum(norms, axis=1),
+        "temporal_gap_hours": gap,
+    }
+
+
+def poisson_scenarios(scenarios, days, norm_rate, processing_rate, seed=None):
+    """
+    Draw daily norm-creation and case-resolution counts from Poisson distributions.
+    Rates are scalars or per-scenario arrays; returns (norms, solved), each (scenarios, days).
+    """
+    rng = np.random.default_rng(seed)
+    norm_rate = np.broadcast_to(np.asarray(norm_rate, dtype=float).reshape(-1, 1), (scenarios, days))
+    processing_rate = np.broadcast_to(np.asarray(processing_rate, dtype=float).reshape(-1, 1), (scenarios, days))
+    return rng.poisson(norm_rate), rng.poisson(processing_rate)
+
+
+def summarize(trajectories, percentiles=(5, 50, 95)):
+    """Percentiles across scenarios of each trajectory's final value, for API responses."""
+    summary = {}
+    for name, values in trajectories.items():
+        final = values[:, -1]
+        final = final[~np.isnan(final)]
+        summary[name] = (
+            {f"p{p}": round(float(v), 2) for p, v in zip(percentiles, np.percentile(final, percentiles))}
+            if final.size else None
+        )
+    return summary
+
+
+async def load_history(session):
+    """
+    Daily valid-norm and solved-case counts from the database, as (days, norms, solved)
+    with every calendar day between the first and last activity present (zeros for gaps).
+    """
+    norms_per_day, cases_per_day = await NormativeInflationModel().calculate_daily_metrics(session)
+    known = sorted(day for day in norms_per_day.keys() | cases_per_day.keys() if day is not None)
+    if not known:
+        return [], np.zeros(0), np.zeros(0)
+
+    days = np.arange(np.datetime64(known[0]), np.datetime64(known[-1]) + 1).astype(object).tolist()
+    norms = np.array([norms_per_day.get(day, 0) for day in days], dtype=float)
+    solved = np.array([cases_per_day.get(day, 0) for day in days], dtype=float)
+    return days, norms, solved
+
+
+async def project_from_history(session, horizon=365, scenarios=1000, norm_rate=None, processing_rate=None,
+                               window=30, seed=None):
+    """
+    What-if projection seeded with the real history: the historical backlog and density are
+    the starting point, and future days are Poisson draws at the given rates (defaulting to
+    the means of the last `window` days of history).
+    Returns (history, projection) where history holds one trajectory and projection `scenarios`.
+    """
+    days, norms, solved = await load_history(session)
+    history = project(norms, solved) if len(days) else None
+
+    if norm_rate is None:
+        norm_rate = float(norms[-window:].mean()) if len(days) else 0.0
+    if processing_rate is None:
+        processing_rate = float(solved[-window:].mean()) if len(days) else 0.0
+
+    future_norms, future_solved = poisson_scenarios(scenarios, horizon, norm_rate, processing_rate, seed)
+    projection = project(
+        future_norms, future_solved,
+        initial_backlog=history["backlog"][0, -1] if history else 0,
+        initial_density=history["cumulative_density"][0, -1] if history else 0,
+    )
+    return {
+        "days": days,
+        "history": history,
+        "norm_rate": norm_rate,
+        "processing_rate": processing_rate,
+    }, projection
@@ -0,0 +1,222 @@
+#models/queries.py
+
+import base64
+import json
+import orjson
+from datetime import datetime
+from sqlalchemy import and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm import selectinload
+from backend.models.case import Case
+from backend.models.norm import Norm
+
+# Columns that can be requested through `fields=` on the case listing endpoints
+CASE_FIELDS = {
+    "id": Case.id,
+    "text": Case.text,
+    "norm_id": Case.norm_id,
+    "constitutional": Case.constitutional,
+    "status": Case.status,
+    "created_at": Case.created_at,
+    "resolved_at": Case.resolved_at,
+    "decision": Case.decision,
+}
+
+# Columns that can be requested through `fields=` on the norm exports
+NORM_FIELDS = {
+    "id": Norm.id,
+    "text": Norm.text,
+    "valid": Norm.valid,
+    "complexity": Norm.complexity,
+    "constitutional": Norm.constitutional,
+    "created_at": Norm.created_at,
+}
+
+# Columns of NormResponse, selected by the norm listings
+NORM_RESPONSE_FIELDS = ("id", "text", "valid", "complexity", "constitutional")
+
+CASE_SORT_KEYS = ("id", "created_at")
+
+MAX_PAGE_SIZE = 1000
+
+
+def encode_cursor(values):
+    """Encode keyset values as an opaque, URL-safe cursor token."""
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+def decode_cursor(token, sort):
+    """Decode a cursor produced by `encode_cursor` for the given sort key."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if sort == "created_at":
+            created_at, case_id = payload
+            return datetime.fromisoformat(created_at), int(case_id)
+        (case_id,) = payload
+        return (int(case_id),)
+    except (ValueError, TypeError, json.JSONDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {token}") from e
+
+
+def parse_fields(fields, allowed):
+    """Turn a comma separated `fields=` value into a list of column names."""
+    if not fields:
+        return list(allowed)
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in names if name not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return names
+
+
+def norm_list_query(valid=None, order_by="id"):
+    """Column-only select behind the norm listings: no ORM identity map, no relationships."""
+    query = select(*[NORM_FIELDS[name] for name in NORM_RESPONSE_FIELDS])
+    if valid is not None:
+        query = query.where(Norm.valid == valid)
+    return query.order_by(NORM_FIELDS[order_by], Norm.id)
+
+
+async def fetch_norm_rows(session: AsyncSession, valid=None, order_by="id"):
+    """Norm listing rows as plain dictionaries shaped like NormResponse."""
+    result = await session.execute(norm_list_query(valid, order_by))
+    return [dict(zip(NORM_RESPONSE_FIELDS, row)) for row in result.all()]
+
+
+async def load_norm(session: AsyncSession, norm_id, with_cases=False):
+    """
+    Load one Norm entity for a write path. Relationships are never loaded implicitly
+    (lazy="raise_on_sql"); pass `with_cases=True` only where the cases are used.
+    """
+    query = select(Norm).where(Norm.id == norm_id)
+    if with_cases:
+        query = query.options(selectinload(Norm.cases))
+    result = await session.execute(query)
+    return result.scalars().first()
+
+
+async def load_case(session: AsyncSession, case_id, with_norm=False):
+    """Load one Case entity, with its norm only when asked for."""
+    query = select(Case).where(Case.id == case_id)
+    if with_norm:
+        query = query.options(selectinload(Case.norm))
+    result = await session.execute(query)
+    return result.scalars().first()
+
+
+def build_case_page_query(
+    status=None,
+    norm_id=None,
+    decision=None,
+    created_after=None,
+    created_before=None,
+    resolved_after=None,
+    resolved_before=None,
+    sort="id",
+    order="desc",
+    cursor=None,
+    limit=100,
+    fields=None,
+):
+    """
+    Build the keyset-paginated select behind the case listings.
+    Returns (query, names, keyset_names); the query fetches one extra row so the
+    caller can tell whether another page exists.
+    """
+    if sort not in CASE_SORT_KEYS:
+        raise ValueError(f"Unsupported sort key: {sort}")
+    names = parse_fields(fields, CASE_FIELDS)
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    descending = order == "desc"
+
+    keyset_names = ["created_at", "id"] if sort == "created_at" else ["id"]
+    selected = names + [name for name in keyset_names if name not in names]
+
+    query = select(*[CASE_FIELDS[name] for name in selected])
+
+    if status is not None:
+        query = query.where(Case.status == status)
+    if norm_id is not None:
+        query = query.where(Case.norm_id == norm_id)
+    if decision is not None:
+        query = query.where(Case.decision == decision)
+    if created_after is not None:
+        query = query.where(Case.created_at >= created_after)
+    if created_before is not None:
+        query = query.where(Case.created_at < created_before)
+    if resolved_after is not None:
+        query = query.where(Case.resolved_at >= resolved_after)
+    if resolved_before is not None:
+        query = query.where(Case.resolved_at < resolved_before)
+
+    if cursor:
+        keys = decode_cursor(cursor, sort)
+        if sort == "created_at":
+            last_created_at, last_id = keys
+            if descending:
+                query = query.where(or_(
+                    Case.created_at < last_created_at,
+                    and_(Case.created_at == last_created_at, Case.id < last_id),
+                ))
+            else:
+                query = query.where(or_(
+                    Case.created_at > last_created_at,
+                    and_(Case.created_at == last_created_at, Case.id > last_id),
+                ))
+        else:
+            (last_id,) = keys
+            query = query.where(Case.id < last_id if descending else Case.id > last_id)
+
+    ordering = [CASE_FIELDS[name] for name in keyset_names]
+    query = query.order_by(*[column.desc() if descending else column.asc() for column in ordering])
+
+    return query.limit(limit + 1), names, keyset_names
+
+
+async def fetch_case_page(session: AsyncSession, limit=100, **filters):
+    """
+    Fetch one keyset-paginated page of cases as plain dictionaries of raw column values
+    (serialized later by serialization.CASE_LIST).
+    Only the requested columns (plus the keyset columns) are selected, so the cost
+    is bounded by the page size rather than the size of the table.
+    Returns (cases, next_cursor); next_cursor is None on the last page.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    query, names, keyset_names = build_case_page_query(limit=limit, **filters)
+
+    result = await session.execute(query)
+    rows = result.all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]._mapping
+        next_cursor = encode_cursor([last[name] for name in keyset_names])
+
+    # Selected columns start with `names`; trailing keyset-only columns are dropped by zip
+    cases = [dict(zip(names, row)) for row in rows]
+    return cases, next_cursor
+
+
+async def stream_ndjson(session: AsyncSession, query, names, fetch_size=1000):
+    """
+    Stream the rows of `query` as newline-delimited JSON.
+    Rows come from a server-side cursor, `fetch_size` at a time, and each batch is
+    yielded as one chunk, so memory stays flat regardless of the result size.
+    """
+    result = await session.stream(query.execution_options(yield_per=fetch_size))
+    async for partition in result.partitions(fetch_size):
+        # orjson encodes datetimes and DecisionEnum values natively
+        yield b"".join(orjson.dumps(dict(zip(names, row))) + b"\n" for row in partition)
+
+
+def build_export_query(model_fields, names, order_column, **filters):
+    """Column-only select for an export, ordered on the primary key and filtered by equality."""
+    query = select(*[model_fields[name] for name in names])
+    for name, value in filters.items():
+        if value is not None:
+            query = query.where(model_fields[name] == value)
+    return query.order_by(order_column)
@@ -0,0 +1,56 @@
+#models/resources.py
+
+import time
+import inspect
+from backend.models.logs import get_logger
+
+log = get_logger("lifespan")
+
+
+class Resources:
+    """
+    Process-wide resources owned by the app lifespan.
+    Nothing is built at import: each resource is built on first access from its registered
+    builder, and `aclose` tears down whatever was built, in reverse build order.
+    """
+
+    def __init__(self):
+        self._builders = {}
+        self._instances = {}
+        self._closers = []
+        self.timings = {}  # Seconds spent building each resource
+
+    def register(self, name, build, close=None):
+        """Declare `name`, built by `build()` and released by `close(instance)` (sync or async)."""
+        self._builders[name] = (build, close)
+
+    def get(self, name):
+        if name not in self._instances:
+            build, close = self._builders[name]
+            started = time.perf_counter()
+            instance = build()
+            self.timings[name] = round(time.perf_counter() - started, 4)
+            self._instances[name] = instance
+            if close is not None:
+                self._closers.append((name, close, instance))
+        return self._instances[name]
+
+    def __getattr__(self, name):
+        if name.startswith("_") or name not in self._builders:
+            raise AttributeError(name)
+        return self.get(name)
+
+    def built(self, name):
+        return name in self._instances
+
+    async def aclose(self):
+        """Release every built resource, newest first; one failing teardown doesn't stop the others."""
+        while self._closers:
+            name, close, instance = self._closers.pop()
+            try:
+                result = close(instance)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                log.error("❌ Failed to close %s: %s", name, e)
+        self._instances.clear()
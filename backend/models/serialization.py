@@ -0,0 +1,74 @@
+#models/serialization.py
+
+from datetime import datetime
+from typing import List, Optional, Union
+import orjson
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+from typing_extensions import TypedDict
+from backend.models.case import DecisionEnum
+
+# Row shapes of the list endpoints. Serializers are compiled once here, and rows are
+# dumped straight from column tuples: no ORM instances, no per-row model validation.
+
+
+class NormRecord(TypedDict):
+    id: int
+    text: str
+    valid: Optional[bool]
+    complexity: int
+    constitutional: Optional[bool]
+
+
+class CaseRecord(TypedDict, total=False):  # Partial when `fields=` projects columns
+    id: int
+    text: str
+    norm_id: int
+    constitutional: bool
+    status: str
+    created_at: Optional[datetime]
+    resolved_at: Union[datetime, str, None]  # "Pending" placeholder on the solved listing
+    decision: Optional[DecisionEnum]
+
+
+class ActivityRecord(TypedDict):
+    id: Optional[int]  # None until the entry is inserted
+    name: str
+    description: Optional[str]
+    created_at: datetime
+
+
+NORM_LIST = TypeAdapter(List[NormRecord])
+CASE_LIST = TypeAdapter(List[CaseRecord])
+ACTIVITY_LIST = TypeAdapter(List[ActivityRecord])
+
+
+class RawJSON(bytes):
+    """Already-serialized JSON, embedded as-is by `json_object`."""
+
+
+def dump_list(adapter, items):
+    return RawJSON(adapter.dump_json(items))
+
+
+def json_object(**fields):
+    """
+    Serialize an envelope such as {"cases": [...], "next_cursor": ...} where the large list
+    has been dumped by a TypeAdapter; only the small remaining values go through orjson.
+    """
+    parts = []
+    for key, value in fields.items():
+        encoded = value if isinstance(value, RawJSON) else orjson.dumps(value)
+        parts.append(orjson.dumps(key) + b":" + encoded)
+    return RawJSON(b"{" + b",".join(parts) + b"}")
+
+
+class FastJSONResponse(Response):
+    """JSON response rendered by orjson, or passed through when the body is pre-serialized."""
+
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
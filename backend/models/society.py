@@ -1,32 +1,188 @@
 #society.py
 
+import math
 import asyncio
-import logging
+import random
+from datetime import timedelta
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from backend.models.logs import get_logger
+
+log = get_logger("society")
+
+MAX_SERIES_POINTS = 1000  # Cap on the optional fast-forward series
 
 class Society:
     def __init__(self):
         self.parliament = None  # Placeholder for PoliticalSystem
         self.judicial_system = None  # Placeholder for JudicialSystem
         self.citizen_pressure = None  # Placeholder for CitizenPressure
+        self.inflation = None  # Placeholder for NormativeInflationModel
+        self.statistics = None  # Placeholder for the Counter statistics cache
         self.iteration = 0
+        self.judicial_carry = 0  # Capacity points already spent on the oldest pending case (step)
 
     def initialize_systems(self, session: AsyncSession):
         """Initialize system components with an async session."""
         from .political_system import PoliticalSystem
         from .judicial_system import JudicialSystem
         from .citizen_pressure import CitizenPressure
+        from .analysis import Counter, NormativeInflationModel
 
         self.parliament = PoliticalSystem()
         self.judicial_system = JudicialSystem()
         self.citizen_pressure = CitizenPressure(self.judicial_system, self.parliament)
-        logging.info("✅ Systems initialized: Parliament, Judicial System, Citizen Pressure")
+        self.inflation = NormativeInflationModel()  # Long-lived, so running aggregates persist
+        self.statistics = Counter()  # Updated in place by every write path
+        log.info("✅ Systems initialized: Parliament, Judicial System, Citizen Pressure")
 
-    async def simulate(self, session: AsyncSession, simulation_days=100):
-        """Simulate society for a given number of days."""
+    async def simulate(self, session: AsyncSession, simulation_days=100, day_length=1):
+        """Simulate society for a given number of days, pausing `day_length` seconds per day."""
         while self.iteration < simulation_days:
             self.iteration += 1
             norm = await self.parliament.create_norm(session)  # Create a new norm
-            await self.judicial_system.check_constitutionality(norm)  # Check its constitutionality
-            await self.citizen_pressure.generate_daily_cases(session)  # Generate citizen pressure cases
-            await asyncio.sleep(1)  # Pause for 1 second to simulate a day
+            if norm:
+                self.inflation.record_norms(1)
+                self.statistics.record_norms_created(1)
+                await self.judicial_system.check_constitutionality(norm)  # Check its constitutionality
+            cases = await self.citizen_pressure.generate_daily_cases(session)  # Generate citizen pressure cases
+            self.statistics.record_cases_created(len(cases))
+            await asyncio.sleep(day_length)  # Pause to simulate a day
+
+    async def step(self, session: AsyncSession, when, norms_per_day=1, complexity_distribution=None,
+                   judicial_capacity=0):
+        """
+        Simulate one dated day: norms and citizen cases are filed at `when`, then the oldest
+        pending cases are decided at midday until `judicial_capacity` complexity points
+        (the summed complexity of their norms) are spent. When the next case doesn't fit, the
+        unspent points carry over to the next day as work already done on it, so a case
+        costlier than one day's capacity is decided after several days instead of never.
+        """
+        from .norm import Norm
+        from .case import Case
+
+        self.iteration += 1
+        day = when.date()
+
+        rows = self.parliament.build_norm_rows(norms_per_day, complexity_distribution)
+        for row in rows:
+            row["created_at"] = when
+        if rows:
+            await session.execute(insert(Norm), rows)
+            self.inflation.record_norms(len(rows), day)
+            self.statistics.record_norms_created(len(rows))
+
+        result = await session.execute(select(Norm.id, Norm.text).where(Norm.valid == True))
+        case_rows = self.citizen_pressure.build_case_rows(result.all(), self.citizen_pressure.daily_case_count)
+        for row in case_rows:
+            row["created_at"] = when
+        if case_rows:
+            await session.execute(insert(Case), case_rows)
+            self.statistics.record_cases_created(len(case_rows))
+        await session.commit()
+
+        solved = []
+        if judicial_capacity > 0:
+            budget = judicial_capacity + self.judicial_carry
+            # Every case costs at least one point, so at most `budget` are candidates
+            result = await session.execute(
+                select(Case.id, Norm.complexity)
+                .join(Norm, Case.norm_id == Norm.id)
+                .where(Case.status == "pending")
+                .order_by(Case.id)
+                .limit(budget)
+            )
+            case_ids, spent = [], 0
+            self.judicial_carry = 0
+            for case_id, complexity in result.all():
+                cost = complexity or 1
+                if spent + cost > budget:
+                    self.judicial_carry = budget - spent  # Progress on the case that didn't fit
+                    break
+                spent += cost
+                case_ids.append(case_id)
+
+            if case_ids:
+                decision = random.choice(["Accepted", "Rejected"])
+                solved, resolved_at, _ = await self.judicial_system.solve_cases(
+                    session, decision, case_ids=case_ids, resolved_at=when + timedelta(hours=12)
+                )
+            if solved:
+                wait_seconds = sum((resolved_at - created_at).total_seconds() for _, created_at in solved)
+                self.inflation.record_cases_solved(len(solved), wait_seconds, day)
+                self.statistics.record_cases_solved(len(solved))
+
+        return {"day": self.iteration, "norms": len(rows), "cases": len(case_rows), "solved": len(solved)}
+
+    async def fast_forward(self, session: AsyncSession, days=100, batch_days=1000, start_date=None, series=False):
+        """
+        Simulate `days` days without pausing, inserting norms and cases in bulk.
+        Each batch of `batch_days` days costs one norm INSERT, one case INSERT and one commit.
+        If `start_date` is given, rows are backdated one day apart from it.
+        Returns the totals; with `series`, also cumulative counts after committed batches,
+        sampled down to about MAX_SERIES_POINTS points (the last batch is always included).
+        """
+        from .norm import Norm
+        from .case import Case
+
+        # Pool of valid norms that citizen pressure can target, grown as days pass
+        result = await session.execute(select(Norm.id, Norm.text).where(Norm.valid == True))
+        valid_norms = [tuple(row) for row in result.all()]
+
+        norms_created = cases_created = done = 0
+        points = []
+        sample_every = math.ceil(math.ceil(days / batch_days) / MAX_SERIES_POINTS)  # Batches per series point
+        remaining = days
+
+        try:
+            while remaining > 0:
+                batch = min(batch_days, remaining)
+                first_day = self.iteration + 1
+
+                norm_rows = self.parliament.build_norm_rows(batch)
+                if start_date is not None:
+                    for offset, row in enumerate(norm_rows):
+                        row["created_at"] = start_date + timedelta(days=first_day + offset - 1)
+
+                # One multi-row INSERT ... RETURNING for the whole batch, ids in parameter order
+                norm_ids = (await session.scalars(
+                    insert(Norm).returning(Norm.id, sort_by_parameter_order=True), norm_rows
+                )).all()
+
+                case_rows = []
+                for offset, (norm_id, norm_row) in enumerate(zip(norm_ids, norm_rows)):
+                    valid_norms.append((norm_id, norm_row["text"]))
+                    day_rows = self.citizen_pressure.build_case_rows(
+                        valid_norms, self.citizen_pressure.daily_case_count
+                    )
+                    if start_date is not None:
+                        for case_row in day_rows:
+                            case_row["created_at"] = norm_row["created_at"]
+                    case_rows.extend(day_rows)
+
+                if case_rows:
+                    await session.execute(insert(Case), case_rows)
+                await session.commit()
+                self.statistics.record_norms_created(len(norm_rows))
+                self.statistics.record_cases_created(len(case_rows))
+
+                self.iteration += batch
+                remaining -= batch
+                norms_created += len(norm_rows)
+                cases_created += len(case_rows)
+                done += 1
+                if series and (done % sample_every == 0 or remaining == 0):
+                    points.append({"day": self.iteration, "norms": norms_created, "cases": cases_created})
+                log.info("⏩ Fast-forwarded to day %s (%s norms, %s cases)", self.iteration, len(norm_rows), len(case_rows))
+        except Exception:
+            await session.rollback()
+            raise
+
+        # Rows may be backdated, so rebuild the inflation aggregates once instead of per day
+        await self.inflation.refresh(session)
+
+        summary = {"iteration": self.iteration, "days": days, "norms": norms_created, "cases": cases_created}
+        if series:
+            summary["series"] = points
+        return summary
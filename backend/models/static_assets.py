@@ -0,0 +1,219 @@
+#models/static_assets.py
+
+"""
+Static serving for the Vue build (`frontend/dist`).
+
+The directory is scanned once at startup into a manifest: content type, ETag, cache policy
+and the precompressed variants of every file. Requests are answered from that manifest,
+so serving an asset costs a dictionary lookup and never touches the filesystem for files
+held in memory (everything up to STATIC_MEMORY_LIMIT bytes).
+
+Variants come from `.br` / `.gz` siblings written at build time; files without a gzip
+sibling are gzipped in memory at startup. To precompress a build (brotli needs the
+optional `brotli` package):
+
+    python -m backend.models.static_assets frontend/dist
+"""
+
+import os
+import sys
+import gzip
+import hashlib
+import mimetypes
+from pathlib import Path
+from fastapi.responses import FileResponse, Response
+
+try:
+    import brotli
+except ImportError:  # Optional: only needed to precompress .br variants
+    brotli = None
+
+STATIC_MEMORY_LIMIT = int(os.getenv("STATIC_MEMORY_LIMIT", 256 * 1024))  # Larger files are streamed from disk
+COMPRESS_MIN_SIZE = 1024  # Not worth a variant below this
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml", "application/xml")
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))  # Server preference order
+
+IMMUTABLE = "public, max-age=31536000, immutable"  # Content-hashed build output under assets/
+REVALIDATE = "no-cache"  # index.html: always revalidated with its ETag
+SHORT_LIVED = "public, max-age=3600"  # Other unhashed files (favicon, robots.txt...)
+
+
+def is_compressible(content_type):
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class Variant:
+    """One encoding of a file: its bytes in memory, or its path and size on disk."""
+
+    __slots__ = ("encoding", "etag", "body", "path", "stat")
+
+    def __init__(self, encoding, etag, body=None, path=None, stat=None):
+        self.encoding = encoding
+        self.etag = etag
+        self.body = body
+        self.path = path
+        self.stat = stat
+
+
+class StaticFile:
+    __slots__ = ("content_type", "cache_control", "variants")
+
+    def __init__(self, content_type, cache_control, variants):
+        self.content_type = content_type
+        self.cache_control = cache_control
+        self.variants = variants  # {encoding or None for identity: Variant}
+
+    def headers(self, variant):
+        headers = {"ETag": variant.etag, "Cache-Control": self.cache_control}
+        if len(self.variants) > 1:
+            headers["Vary"] = "Accept-Encoding"
+        if variant.encoding:
+            headers["Content-Encoding"] = variant.encoding
+        return headers
+
+
+def accepted_encodings(header):
+    """Encodings with a non-zero q-value in an Accept-Encoding header."""
+    accepted = set()
+    for part in (header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        if name:
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+def etag_matches(header, etag):
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in header.split(","))
+
+
+def load_variant(path, encoding, digest, data=None):
+    stat = path.stat()
+    etag = f'"{digest}-{encoding}"' if encoding else f'"{digest}"'
+    if stat.st_size <= STATIC_MEMORY_LIMIT:
+        return Variant(encoding, etag, body=data if data is not None else path.read_bytes())
+    return Variant(encoding, etag, path=path, stat=stat)
+
+
+class StaticSite:
+    """Manifest of a built single-page app, with history-mode fallback to index.html."""
+
+    def __init__(self, root, files):
+        self.root = root
+        self.files = files  # URL path (no leading slash) -> StaticFile
+        self.index = files.get("index.html")
+
+    @classmethod
+    def build(cls, root):
+        root = Path(root)
+        if not (root / "index.html").is_file():
+            raise RuntimeError(f"Frontend build not found at: {root}")
+
+        files = {}
+        for path in sorted(root.rglob("*")):
+            if not path.is_file() or path.suffix in (".br", ".gz") or path.suffix == ".map":
+                continue
+            url = path.relative_to(root).as_posix()
+            content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+            if content_type.startswith("text/") or content_type == "application/javascript":
+                content_type += "; charset=utf-8"
+
+            # Hashing reads the file once; the identity bytes are kept if small enough
+            data = path.read_bytes()
+            digest = hashlib.blake2b(data, digest_size=8).hexdigest()
+            identity = load_variant(path, None, digest, data)
+            variants = {None: identity}
+
+            if is_compressible(content_type) and len(data) >= COMPRESS_MIN_SIZE:
+                for encoding, suffix in ENCODINGS:
+                    sibling = path.with_name(path.name + suffix)
+                    if sibling.is_file():
+                        variants[encoding] = load_variant(sibling, encoding, digest)
+                if "gzip" not in variants and identity.body is not None:
+                    variants["gzip"] = Variant("gzip", f'"{digest}-gzip"', body=gzip.compress(data, mtime=0))
+
+            if url == "index.html":
+                cache_control = REVALIDATE
+            elif url.startswith("assets/"):
+                cache_control = IMMUTABLE
+            else:
+                cache_control = SHORT_LIVED
+            files[url] = StaticFile(content_type, cache_control, variants)
+        return cls(root, files)
+
+    def lookup(self, path):
+        """The manifest entry for a request path; unknown non-asset paths get index.html."""
+        entry = self.files.get(path)
+        if entry is None and not path.startswith("assets/"):
+            entry = self.index
+        return entry
+
+    def respond(self, path, headers, method="GET"):
+        entry = self.lookup(path)
+        if entry is None:
+            return Response(status_code=404)
+
+        accepted = accepted_encodings(headers.get("accept-encoding"))
+        variant = entry.variants[None]
+        for encoding, _ in ENCODINGS:
+            if encoding in accepted and encoding in entry.variants:
+                variant = entry.variants[encoding]
+                break
+
+        response_headers = entry.headers(variant)
+        if etag_matches(headers.get("if-none-match"), variant.etag):
+            return Response(status_code=304, headers=response_headers)
+        if variant.body is None:
+            return FileResponse(
+                variant.path, headers=response_headers, media_type=entry.content_type,
+                stat_result=variant.stat, method=method,
+            )
+        body = b"" if method == "HEAD" else variant.body
+        response = Response(body, headers=response_headers, media_type=entry.content_type)
+        if method == "HEAD":
+            response.headers["content-length"] = str(len(variant.body))
+        return response
+
+    def stats(self):
+        variants = [variant for entry in self.files.values() for variant in entry.variants.values()]
+        return {
+            "files": len(self.files),
+            "variants": len(variants),
+            "memory_bytes": sum(len(variant.body) for variant in variants if variant.body is not None),
+            "on_disk": sum(variant.body is None for variant in variants),
+        }
+
+
+def precompress(root):
+    """Write .gz (and .br when brotli is installed) siblings for every compressible build file."""
+    written = 0
+    for path in Path(root).rglob("*"):
+        if not path.is_file() or path.suffix in (".br", ".gz", ".map"):
+            continue
+        content_type = mimetypes.guess_type(path.name)[0] or ""
+        data = path.read_bytes()
+        if not is_compressible(content_type) or len(data) < COMPRESS_MIN_SIZE:
+            continue
+        path.with_name(path.name + ".gz").write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+        written += 1
+        if brotli is not None:
+            path.with_name(path.name + ".br").write_bytes(brotli.compress(data, quality=11))
+            written += 1
+    return written
+
+
+if __name__ == "__main__":
+    target = sys.argv[1] if len(sys.argv) > 1 else "frontend/dist"
+    if brotli is None:
+        print("⚠️ brotli is not installed: writing gzip variants only (pip install brotli)")
+    print(f"✅ Wrote {precompress(target)} precompressed files in {target}")
@@ -0,0 +1,189 @@
+#models/sweep.py
+
+"""
+Monte Carlo parameter sweeps over independent Society simulations.
+
+Every run gets its own process (from a ProcessPoolExecutor), its own in-memory SQLite
+database, its own Society and its own random seed, so runs share nothing and a sweep
+uses every core. Each run simulates dated days with Society.step and reports the
+NormativeInflationModel outputs in one row of the result table.
+
+    python -m backend.models.sweep --days 365 --seeds 8 \
+        --grid daily_case_count=5,10,20 --grid judicial_capacity=5,10 --grid complexity=1-5,1-10 \
+        --output sweep.csv
+
+Requires aiosqlite for the per-run databases.
+"""
+
+import os
+import csv
+import json
+import time
+import random
+import asyncio
+import argparse
+import itertools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from pathlib import Path
+from backend.models.logs import configure_logging, get_logger
+
+log = get_logger("sweep")
+
+# Parameters of one run and their defaults
+DEFAULT_PARAMETERS = {
+    "days": 100,
+    "norms_per_day": 1,
+    "daily_case_count": 5,
+    "complexity": "1-10",       # Uniform complexity range "min-max"
+    "judicial_capacity": 30,    # Complexity points of cases decided per day
+}
+
+
+def complexity_range(value):
+    low, _, high = str(value).partition("-")
+    low, high = int(low), int(high or low)
+    return {complexity: 1 for complexity in range(low, high + 1)}
+
+
+def expand_grid(grid, seeds=1, base_seed=0, **fixed):
+    """Cartesian product of `grid` ({name: [values]}) times `seeds`, as run parameter dicts."""
+    names = list(grid)
+    scenarios = []
+    for values in itertools.product(*(grid[name] for name in names)):
+        for replica in range(seeds):
+            params = {**DEFAULT_PARAMETERS, **fixed, **dict(zip(names, values))}
+            params["run"] = len(scenarios)
+            params["seed"] = base_seed + len(scenarios)
+            params["replica"] = replica
+            scenarios.append(params)
+    return scenarios
+
+
+async def simulate(params):
+    """Run one scenario against a private in-memory database and collect its inflation metrics."""
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    from sqlalchemy.pool import StaticPool
+    from backend.models import Base
+    from backend.models.norm import Norm  # noqa: F401 - registers the tables on Base.metadata
+    from backend.models.case import Case  # noqa: F401
+    from backend.models.society import Society
+
+    random.seed(params["seed"])
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+        async with session_factory() as session:
+            society = Society()
+            society.initialize_systems(session)
+            society.citizen_pressure.daily_case_count = params["daily_case_count"]
+            await society.inflation.refresh(session)  # Empty database: seeds the aggregates at zero
+
+            distribution = complexity_range(params["complexity"])
+            start = datetime(2000, 1, 1)
+            peak_backlog = 0
+            started = time.perf_counter()
+            for day in range(params["days"]):
+                await society.step(
+                    session, start + timedelta(days=day),
+                    norms_per_day=params["norms_per_day"],
+                    complexity_distribution=distribution,
+                    judicial_capacity=params["judicial_capacity"],
+                )
+                await society.inflation.update_metrics(session)
+                peak_backlog = max(peak_backlog, society.inflation.backlog)
+
+            inflation = society.inflation
+            statistics = society.statistics
+            return {
+                **params,
+                "normative_density": inflation.normative_density,
+                "processing_rate": inflation.processing_rate,
+                "backlog": inflation.backlog,
+                "temporal_gap_hours": inflation.temporal_gap,
+                "peak_backlog": peak_backlog,
+                "norms": statistics.total_norms,
+                "cases": statistics.total_cases,
+                "solved": statistics.solved_cases,
+                "pending": statistics.pending_cases,
+                "seconds": round(time.perf_counter() - started, 3),
+            }
+    finally:
+        await engine.dispose()
+
+
+def run_scenario(params):
+    """Process pool entry point: one scenario on a fresh event loop."""
+    return asyncio.run(simulate(params))
+
+
+def quiet_worker():
+    # Keep worker output to warnings
+    configure_logging(level="WARNING")
+
+
+def run_sweep(scenarios, max_workers=None):
+    """Run every scenario in a process pool and return the result rows ordered by run."""
+    rows = []
+    context = multiprocessing.get_context("spawn")  # No inherited event loop or engine state
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(), mp_context=context,
+                             initializer=quiet_worker) as executor:
+        futures = {executor.submit(run_scenario, params): params for params in scenarios}
+        for future in as_completed(futures):
+            params = futures[future]
+            try:
+                rows.append(future.result())
+            except Exception as e:
+                log.error("❌ Sweep run %s failed: %s", params["run"], e)
+                rows.append({**params, "error": str(e)})
+            print(f"  {len(rows)}/{len(scenarios)} runs done", end="\r")
+    print()
+    return sorted(rows, key=lambda row: row["run"])
+
+
+def write_table(rows, path):
+    """Write the result table as CSV, or as JSON when `path` ends in .json."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".json":
+        path.write_text(json.dumps(rows, indent=2))
+        return
+    fields = list(dict.fromkeys(key for row in rows for key in row))
+    with path.open("w", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def parse_grid(values):
+    """Turn repeated `name=v1,v2` options into {name: [v1, v2]}, ints where possible."""
+    grid = {}
+    for value in values or []:
+        name, _, options = value.partition("=")
+        if name not in DEFAULT_PARAMETERS:
+            raise SystemExit(f"❌ Unknown sweep parameter: {name} (expected one of {', '.join(DEFAULT_PARAMETERS)})")
+        grid[name] = [int(option) if option.isdigit() else option for option in options.split(",") if option]
+    return grid
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--grid", action="append", help="Swept parameter as name=v1,v2 (repeatable)")
+    parser.add_argument("--days", type=int, default=DEFAULT_PARAMETERS["days"])
+    parser.add_argument("--seeds", type=int, default=4, help="Replicas per parameter combination")
+    parser.add_argument("--base-seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="Processes (default: every core)")
+    parser.add_argument("--output", default="sweep_results/sweep.csv", help="CSV or .json result table")
+    args = parser.parse_args()
+    configure_logging()
+
+    scenarios = expand_grid(parse_grid(args.grid), seeds=args.seeds, base_seed=args.base_seed, days=args.days)
+    print(f"⏱️  Running {len(scenarios)} simulations on {args.workers or os.cpu_count()} processes...")
+    started = time.perf_counter()
+    results = run_sweep(scenarios, args.workers)
+    write_table(results, args.output)
+    print(f"✅ {len(results)} runs in {time.perf_counter() - started:.1f}s, results saved to {args.output}")
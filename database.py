@@ -1,10 +1,11 @@
-#database.py 
+#database.py
 
 import os
 import asyncio
 from dotenv import load_dotenv
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from backend.models import Base, register_models  # Import the register_models function
 
 # Load environment variables
@@ -13,38 +14,128 @@ load_dotenv()
 # Retrieve database URL
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-if not DATABASE_URL:
-    raise ValueError("❌ DATABASE_URL is not set! Check your .env file or environment variables.")
+# Pool and driver settings, overridable per deployment
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() in ("1", "true", "yes")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 20))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", 500))
 
-print(f"DEBUG: DATABASE_URL = {DATABASE_URL}")
 
-engine = create_async_engine(DATABASE_URL, echo=True, future=True)
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that also tracks checkouts waiting for a free connection."""
 
-# Register models so Alembic knows about them
-register_models(engine)  # Pass the engine to register models
+    # Log under sqlalchemy.pool like the stock pools, so the logging overrides cover it
+    _sqla_logger_namespace = "sqlalchemy.pool.impl.InstrumentedQueuePool"
 
-# Create an async session factory
-AsyncSessionLocal = sessionmaker(
-    bind=engine,
-    class_=AsyncSession,
-    expire_on_commit=False
-)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.waiting = 0
+        self.max_waiting = 0
+        self.timeouts = 0
+
+    def _do_get(self):
+        # Only checkouts that find no idle connection and no overflow room will wait
+        if not self._pool.empty() or self._max_overflow == -1 or self._overflow < self._max_overflow:
+            return super()._do_get()
+
+        self.waiting += 1
+        self.max_waiting = max(self.max_waiting, self.waiting)
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            self.waiting -= 1
+
+
+def engine_options(url):
+    """Keyword arguments for create_async_engine based on the configured driver."""
+    options = {"echo": DB_ECHO, "future": True}
+    if ":memory:" in url:
+        return options
+
+    options.update(
+        poolclass=InstrumentedQueuePool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+    )
+    if url.startswith("postgresql+asyncpg"):
+        # Cache prepared statements on each asyncpg connection
+        options["connect_args"] = {"prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE}
+    return options
+
+
+# The single engine shared by the app, the models and Alembic, created on first use
+_engine = None
+_session_factory = None
+
+
+def get_engine():
+    global _engine
+    if _engine is None:
+        if not DATABASE_URL:
+            raise ValueError("❌ DATABASE_URL is not set! Check your .env file or environment variables.")
+        _engine = create_async_engine(DATABASE_URL, **engine_options(DATABASE_URL))
+        register_models(_engine)  # Register models so Alembic knows about them
+    return _engine
+
+
+def get_sessionmaker():
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = async_sessionmaker(bind=get_engine(), class_=AsyncSession, expire_on_commit=False)
+    return _session_factory
+
+
+def __getattr__(name):
+    # `from database import engine, AsyncSessionLocal` keeps working, without building anything at import
+    if name == "engine":
+        return get_engine()
+    if name == "AsyncSessionLocal":
+        return get_sessionmaker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Base model for SQLAlchemy
-Base = declarative_base()
 
 # Dependency for database session
 async def get_db():
-    async with AsyncSessionLocal() as session:
+    async with get_sessionmaker()() as session:
         yield session
 
+def pool_status():
+    """Snapshot of the connection pool for the debug endpoint."""
+    if _engine is None:
+        return {"pool": None}
+    pool = _engine.pool
+    if not isinstance(pool, InstrumentedQueuePool):
+        return {"pool": type(pool).__name__}
+    return {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(0, pool.overflow()),
+        "max_overflow": DB_MAX_OVERFLOW,
+        "waiting": pool.waiting,
+        "max_waiting": pool.max_waiting,
+        "timeouts": pool.timeouts,
+        "recycle_seconds": DB_POOL_RECYCLE,
+        "statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+    }
+
 # Function to initialize database and create tables
 async def init_db():
     # Create tables with AsyncEngine
-    async with engine.begin() as conn:
+    async with get_engine().begin() as conn:
         # Use run_sync for async engine
         await conn.run_sync(Base.metadata.create_all)
     print("✅ Database tables created successfully!")
+    await get_engine().dispose()
 
 # Run database initialization if executed directly
 if __name__ == "__main__":
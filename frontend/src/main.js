@@ -1,6 +1,7 @@
 import { createApp } from 'vue';
 import App from './App.vue';
 import router from './router';
+import { fetchPage } from './pagination.js';
 
 // ✅ Stocke Vue globalement (évite les conflits)
 let vueApp = null;
@@ -101,19 +102,14 @@ async function loadSolvedCases() {
   console.log("🔄 Calling loadSolvedCases()...");
 
   try {
-    const response = await fetch(`${import.meta.env.VITE_API_BASE_URL}/api/get_solved_cases`);
-    const data = await response.json();
+    // Newest page only (the API sorts by id, descending); older pages load on demand
+    const { rows: solvedCases } = await fetchPage('/api/get_solved_cases', 'solved_cases');
 
-    if (!Array.isArray(data.solved_cases)) {
-      console.warn("⚠️ API did not return an array for solved_cases.");
-      return;
-    }
-
-    console.log("📡 Solved Cases Updated:", data.solved_cases);
+    console.log("📡 Solved Cases Updated:", solvedCases);
 
     // Met à jour l'état Vue si nécessaire
     if (window.__VUE_APP__._instance) {
-      window.__VUE_APP__._instance.proxy.solvedCases = data.solved_cases.sort((a, b) => b.id - a.id);
+      window.__VUE_APP__._instance.proxy.solvedCases = solvedCases;
     }
   } catch (error) {
     console.error("❌ Error loading solved cases:", error);
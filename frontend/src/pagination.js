@@ -0,0 +1,32 @@
+// src/pagination.js
+
+import { API_BASE_URL } from './config.js';
+
+// Rows per page requested by the tables (the API accepts up to 1000)
+export const PAGE_SIZE = 100;
+
+// Fetch one keyset page of a case listing, newest first. `key` names the list in the
+// response (e.g. "solved_cases"); pass the returned `nextCursor` back to get the next page,
+// which is null once the listing is exhausted.
+export async function fetchPage(path, key, { cursor = null, limit = PAGE_SIZE, ...params } = {}) {
+  const query = new URLSearchParams({ limit, ...params });
+  if (cursor) query.set('cursor', cursor);
+
+  const response = await fetch(`${API_BASE_URL}${path}?${query}`);
+  if (!response.ok) {
+    throw new Error(`${path} failed with status ${response.status}`);
+  }
+
+  const data = await response.json();
+  return { rows: data[key] ?? [], nextCursor: data.next_cursor ?? null };
+}
+
+// Merge a freshly fetched first page into the rows already shown (newest first). The new
+// page replaces everything down to its oldest id; older rows loaded with "Load more" are
+// kept, along with the cursor that continues after them.
+export function mergeFirstPage(page, loaded, loadedCursor) {
+  if (!page.nextCursor) return page;  // The first page is the whole listing
+  const oldest = Math.min(...page.rows.map(row => row.id));
+  const older = loaded.filter(row => row.id < oldest);
+  return older.length ? { rows: [...page.rows, ...older], nextCursor: loadedCursor } : page;
+}
@@ -2,9 +2,8 @@
 
 import asyncio
 from logging.config import fileConfig
-from sqlalchemy import create_engine
 from alembic import context
-from database import DATABASE_URL
+from database import DATABASE_URL, engine
 from backend.models import Base  # Vérifie que cet import est correct
 
 # Charger la configuration Alembic
@@ -29,11 +28,10 @@ def do_migrations(connection):
         context.run_migrations()
 
 async def run_migrations_online():
-    """Exécute les migrations en mode 'online'."""
-    connectable = create_engine(DATABASE_URL.replace("postgresql+asyncpg", "postgresql"), echo=True)
-
-    with connectable.begin() as connection:
-        do_migrations(connection)
+    """Exécute les migrations en mode 'online' avec le moteur partagé de database.py."""
+    async with engine.begin() as connection:
+        await connection.run_sync(do_migrations)
+    await engine.dispose()
 
 
 def run_migrations_offline():
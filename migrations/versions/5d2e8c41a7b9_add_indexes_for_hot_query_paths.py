@@ -0,0 +1,36 @@
+"""Add indexes for hot query paths
+
+Revision ID: 5d2e8c41a7b9
+Revises: 3ccc2587f134
+Create Date: 2026-10-18 10:12:44.512033
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2e8c41a7b9'
+down_revision: Union[str, None] = '3ccc2587f134'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_cases_status_id', 'cases', ['status', 'id'], unique=False)
+    op.create_index('ix_cases_norm_id_id', 'cases', ['norm_id', 'id'], unique=False)
+    op.create_index('ix_cases_created_at_id', 'cases', ['created_at', 'id'], unique=False)
+    op.create_index('ix_cases_status_resolved_at', 'cases', ['status', 'resolved_at'], unique=False)
+    op.create_index('ix_norms_valid_id', 'norms', ['valid', 'id'], unique=False)
+    op.create_index('ix_norms_created_at', 'norms', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_norms_created_at', table_name='norms')
+    op.drop_index('ix_norms_valid_id', table_name='norms')
+    op.drop_index('ix_cases_status_resolved_at', table_name='cases')
+    op.drop_index('ix_cases_created_at_id', table_name='cases')
+    op.drop_index('ix_cases_norm_id_id', table_name='cases')
+    op.drop_index('ix_cases_status_id', table_name='cases')